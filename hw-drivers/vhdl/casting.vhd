@@ -18,6 +18,10 @@ package casting is
     --! '1' maps to a logical '0'.
     function char_to_logic(c: character) return std_logic;
 
+    --! Casts a hexadecimal character `c` to its 4 logic bits (MSB first). Anything
+    --! not a hexadecimal digit maps to all logical '0's.
+    function char_to_nibble(c: character) return std_logic_vector;
+
 end package;
 
 
@@ -75,4 +79,28 @@ package body casting is
         end if;
     end function;
 
+
+    function char_to_nibble(c: character) return std_logic_vector is
+    begin
+        case c is
+            when '0' => return "0000";
+            when '1' => return "0001";
+            when '2' => return "0010";
+            when '3' => return "0011";
+            when '4' => return "0100";
+            when '5' => return "0101";
+            when '6' => return "0110";
+            when '7' => return "0111";
+            when '8' => return "1000";
+            when '9' => return "1001";
+            when 'a' | 'A' => return "1010";
+            when 'b' | 'B' => return "1011";
+            when 'c' | 'C' => return "1100";
+            when 'd' | 'D' => return "1101";
+            when 'e' | 'E' => return "1110";
+            when 'f' | 'F' => return "1111";
+            when others => return "0000";
+        end case;
+    end function;
+
 end package body;
\ No newline at end of file
@@ -28,9 +28,19 @@ package veriti is
     -- de-assert on the falling edge of the 'cycles' count clock cycle.
     procedure reset_system(signal clk: std_logic; signal rst: out std_logic; cycles: natural);
 
+    -- Encodings for the values written to a trace file. BIN writes each bit as a
+    -- character, while HEX writes each group of 4 bits as a hexadecimal character.
+    type trace_format is (BIN, HEX);
+
     -- Drive a logic[] signal 'wire' with a value from the line 'row'.
     procedure drive(variable row: inout line; signal vec: out std_logic_vector);
 
+    -- Drive a logic[] signal 'vec' with a value encoded as 'fmt' from the line 'row'.
+    procedure drive(variable row: inout line; signal vec: out std_logic_vector; fmt: trace_format);
+
+    -- Drive a logic signal 'wire' with a value encoded as 'fmt' from the line 'row'.
+    procedure drive(variable row: inout line; signal wire: out std_logic; fmt: trace_format);
+
     -- Drive a logic signal 'wire' with a value from the line 'row'.
     procedure drive(variable row: inout line; signal wire: out std_logic);
 
@@ -40,6 +50,12 @@ package veriti is
     -- Read a logic value from the line 'row' into the variable 'ideal'.
     procedure load(variable row: inout line; variable ideal: out std_logic);
 
+    -- Read a logic[] value encoded as 'fmt' from the line 'row' into the variable 'ideal'.
+    procedure load(variable row: inout line; variable ideal: out std_logic_vector; fmt: trace_format);
+
+    -- Read a logic value encoded as 'fmt' from the line 'row' into the variable 'ideal'.
+    procedure load(variable row: inout line; variable ideal: out std_logic; fmt: trace_format);
+
     -- Awaits the flag to be asserted or until delay time is up. Sets 'timeout'
     -- to true when the flag was asserted before the timeout and false if
     -- the timeout was reached before the flag was raised.
@@ -201,6 +217,65 @@ package body veriti is
     end procedure;
 
 
+    procedure drive(variable row: inout line; signal vec: out std_logic_vector; fmt: trace_format) is
+        constant NIBBLES   : positive := (vec'length + 3) / 4;
+        variable word      : string(1 to NIBBLES);
+        variable temp      : std_logic_vector((4*NIBBLES)-1 downto 0);
+        variable delimiter : character;
+    begin
+        if fmt = BIN then
+            drive(row, vec);
+        elsif row'length > 0 then
+            read(row, word);
+            -- the first character holds the upper-most bits
+            for ii in word'range loop
+                temp((4*(NIBBLES-ii))+3 downto 4*(NIBBLES-ii)) := casting.char_to_nibble(word(ii));
+            end loop;
+            -- trim the padding bits from the upper-most nibble
+            vec <= temp(vec'length-1 downto 0);
+            -- ignore the delimiter
+            read(row, delimiter);
+            -- wait for 0 ns;
+        end if;
+    end procedure;
+
+
+    procedure load(variable row: inout line; variable ideal: out std_logic_vector; fmt: trace_format) is
+        constant NIBBLES   : positive := (ideal'length + 3) / 4;
+        variable word      : string(1 to NIBBLES);
+        variable temp      : std_logic_vector((4*NIBBLES)-1 downto 0);
+        variable delimiter : character;
+    begin
+        if fmt = BIN then
+            load(row, ideal);
+        elsif row'length > 0 then
+            read(row, word);
+            -- the first character holds the upper-most bits
+            for ii in word'range loop
+                temp((4*(NIBBLES-ii))+3 downto 4*(NIBBLES-ii)) := casting.char_to_nibble(word(ii));
+            end loop;
+            -- trim the padding bits from the upper-most nibble
+            ideal := temp(ideal'length-1 downto 0);
+            -- ignore the delimiter
+            read(row, delimiter);
+        end if;
+    end procedure;
+
+
+    procedure drive(variable row: inout line; signal wire: out std_logic; fmt: trace_format) is
+    begin
+        -- a single bit is the same character in both encodings
+        drive(row, wire);
+    end procedure;
+
+
+    procedure load(variable row: inout line; variable ideal: out std_logic; fmt: trace_format) is
+    begin
+        -- a single bit is the same character in both encodings
+        load(row, ideal);
+    end procedure;
+
+
     -- LOGGING FUNCTIONS
 
     procedure log_event(file fd: text; sev: log_level; topic: string; cause: string) is
@@ -6,5 +6,5 @@ from . import cast
 from . import log
 from . import trace
 from .lib import *
-from .model import randomize
-from .config import rng_seed, get_generic
\ No newline at end of file
+from .model import randomize, randomize_batch
+from .config import rng_seed, get_generic, Session, get_session
\ No newline at end of file
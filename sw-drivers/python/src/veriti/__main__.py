@@ -89,6 +89,20 @@ def main():
     parser_run.add_argument('--if', dest='design_if', action='store', type=str, metavar='JSON', help='interface data for the design-under-test')
     parser_run.add_argument('--tb-if', dest='bench_if', action='store', type=str, metavar='JSON', help='interface data for the testbench')
     parser_run.add_argument('--work-dir', action='store', type=str, metavar='PATH', help='set the working directory')
+    parser_run.add_argument('--cov-db', action='store', type=str, default=None, metavar='PATH', help='save the bin counts to a coverage database (always saved with --jobs or --seeds)')
+    parser_run.add_argument('--jobs', '-j', action='store', type=int, default=1, metavar='N', help='number of processes to run seeds in parallel')
+    parser_run.add_argument('--seeds', action='store', type=int, nargs='+', default=None, metavar='NUM', help='run the model once per seed, each in its own working directory')
+    parser_run.add_argument('--shared', action='store_true', default=False, help='stop every seed once their combined coverage meets its goals')
+    parser_run.add_argument('--shared-capacity', action='store', type=int, default=None, metavar='BINS', help='maximum number of bins shared per seed')
+    parser_run.add_argument('--shared-interval', action='store', type=int, default=None, metavar='N', help='number of coverage checks between each exchange of shared counts')
+
+    # subcommand: 'cov'
+    parser_cov = sub_parsers.add_parser('cov', help='manage coverage databases')
+    cov_parsers = parser_cov.add_subparsers(dest='action', metavar='action')
+
+    parser_cov_merge = cov_parsers.add_parser('merge', help='sum the bin counts across coverage databases')
+    parser_cov_merge.add_argument('dbs', type=str, nargs='+', metavar='DB', help='paths to coverage databases')
+    parser_cov_merge.add_argument('--out', '-o', type=str, metavar='PATH', help='path to save the merged coverage database')
 
     args = parser.parse_args()
     
@@ -97,14 +111,21 @@ def main():
     if sc == 'make':
         make(args)
     elif sc == 'read':
-        data = log.read(args.log, args.level)
-        print(data)
+        # print each outcome as it is parsed
+        for event in log.stream(args.log, args.level):
+            print(event)
     elif sc == 'check':
         rc = check(args)
         exit(rc)
         pass
     elif sc == 'run':
-        run(args)
+        rc = run(args)
+        exit(rc)
+    elif sc == 'cov':
+        if args.action == 'merge':
+            cov_merge(args)
+        else:
+            parser_cov.print_help()
     elif sc == None:
         parser.print_help()
         pass
@@ -113,9 +134,12 @@ def main():
 
 def check(args: argparse.Namespace):
     config.set(work_dir=args.work_dir, sim_log=args.log, cov_report=args.cov)
-    result = log.check() # and coverage.check()
-    # print('info:', 'Simulation history available at:', log.get_event_log_path(args.log))
-    # print('info:', log.report_score(args.log))
+    # parse the log exactly once and reuse the summary for the entire report
+    summary = log.summarize()
+    result = log.check(lg=summary) # and coverage.check()
+    print('info:', 'Score:', log.report_score(lg=summary))
+    if summary.get_first_fail() != None:
+        print('info:', 'First failure:', summary.get_first_fail())
     if result == True:
         print('info:', 'Passed verification')
         return 0
@@ -125,11 +149,103 @@ def check(args: argparse.Namespace):
 
 
 def run(args: argparse.Namespace):
+    if args.seeds != None or args.jobs > 1:
+        return run_parallel(args)
     # initialize the state of veriti
     config.set(design_if=args.design_if, bench_if=args.bench_if, work_dir=args.work_dir, seed=args.seed, generics=args.generic)
     import runpy
     # run the python model script in its own namespace
     runpy.run_path(args.script, init_globals={})
+    # keep the bin counts to be merged with other runs when requested
+    if args.cov_db != None:
+        coverage.Coverage.save(args.cov_db)
+    return 0
+
+
+def _run_seed(task):
+    '''
+    Runs the model script once for a single seed in a fresh process and returns 
+    the path to its coverage database along with the script's exit status.
+    '''
+    (args, seed, work_dir, shared, worker, workers) = task
+    config.set(design_if=args.design_if, bench_if=args.bench_if, work_dir=work_dir, seed=seed, generics=args.generic)
+    if shared != None:
+        coverage.Coverage.share(shared, workers, worker, capacity=args.shared_capacity, interval=args.shared_interval)
+    import runpy
+    status = 0
+    try:
+        runpy.run_path(args.script, init_globals={})
+    except SystemExit as e:
+        # follow the interpreter's mapping of exit codes to a process status
+        if e.code == None:
+            status = 0
+        elif isinstance(e.code, int) == True:
+            status = e.code
+        else:
+            print('error:', 'Seed', seed, 'exited:', e.code)
+            status = 1
+    return (coverage.Coverage.save(), status)
+
+
+def run_parallel(args: argparse.Namespace):
+    import os, random, sys
+    from multiprocessing import Pool
+
+    # draw a distinct seed for each job when none are given
+    seeds = args.seeds
+    if seeds != None and len(set(seeds)) != len(seeds):
+        # a repeated seed would share its working directory and count its bins twice
+        print('warning:', 'Ignoring repeated seeds')
+        seeds = list(dict.fromkeys(seeds))
+    if seeds == None:
+        seeds = []
+        while len(seeds) < args.jobs:
+            seed = random.randrange(sys.maxsize)
+            if seed not in seeds:
+                seeds += [seed]
+    base_dir = args.work_dir if args.work_dir != None else config.Config()._working_dir
+    # allocate the bin counters that every seed reads to stop once coverage is met together
+    shared = coverage.SharedCoverage.create(len(seeds), capacity=args.shared_capacity) if args.shared == True else None
+    name = shared.get_name() if shared != None else None
+    tasks = [(args, seed, os.path.join(base_dir, 'seed-' + str(seed)), name, i, len(seeds)) for (i, seed) in enumerate(seeds)]
+    try:
+        # give each seed a fresh process so no coverage state carries over between runs
+        with Pool(processes=max(1, args.jobs), maxtasksperchild=1) as pool:
+            results = pool.map(_run_seed, tasks, chunksize=1)
+    finally:
+        if shared != None:
+            shared.close()
+            shared.unlink()
+
+    # merge the databases in seed order to find which seeds met new bins
+    db = coverage.CoverageDB()
+    rc = 0
+    for (seed, (path, status)) in zip(seeds, results):
+        before = db.get_met_bins()
+        db.merge(coverage.CoverageDB.read(path))
+        gained = len(db.get_met_bins() - before)
+        print('info:', 'Seed', seed, 'met', gained, 'new bins' if gained != 1 else 'new bin')
+        if status != 0:
+            print('error:', 'Seed', seed, 'exited with status', status)
+            # report the status of the first seed that failed
+            if rc == 0:
+                rc = status
+        pass
+    path = args.cov_db if args.cov_db != None else os.path.join(base_dir, config.Config().get_cov_db())
+    db.write(path)
+    print('info:', 'Merged coverage database:', os.path.abspath(path))
+    print(db.report(), end='')
+    return rc
+
+
+def cov_merge(args: argparse.Namespace):
+    # sum the bin counts of every database into the first one
+    db = coverage.CoverageDB.read(args.dbs[0])
+    for path in args.dbs[1:]:
+        db.merge(coverage.CoverageDB.read(path))
+    if args.out != None:
+        db.write(args.out)
+    print(db.report(), end='')
     pass
 
 
@@ -242,6 +358,37 @@ file events: text open write_mode is "events.log";
     return result
 
 
+import unittest as _ut
+
+class __Test(_ut.TestCase):
+
+    def test_run_seeds(self):
+        import json, os, subprocess, sys, tempfile
+        with tempfile.TemporaryDirectory() as dir:
+            script = os.path.join(dir, 'model.py')
+            with open(script, 'w') as f:
+                f.write('''from veriti.prelude import *
+cg = CoverGroup('seed bins', bins=[0, 1], goal=1)
+cg.cover(0)
+exit(3)
+''')
+            env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            proc = subprocess.run([sys.executable, '-m', 'veriti', 'run', script, '--work-dir', dir, '--jobs', '2', '--seeds', '1', '2', '1'], env=env, capture_output=True, text=True)
+            self.assertEqual(3, proc.returncode)
+            self.assertEqual(True, 'Seed 2 exited with status 3' in proc.stdout)
+            # each seed saves its own database into its own working directory
+            self.assertEqual(['coverage.json', 'model.py', 'seed-1', 'seed-2'], sorted(os.listdir(dir)))
+            self.assertEqual(True, os.path.exists(os.path.join(dir, 'seed-1', 'coverage.json')))
+            self.assertEqual(True, os.path.exists(os.path.join(dir, 'seed-2', 'coverage.json')))
+            with open(os.path.join(dir, 'coverage.json'), 'r') as f:
+                data = json.load(f)
+        self.assertEqual([1, 2], [r['seed'] for r in data['runs']])
+        self.assertEqual([[0, 2]], data['nets'][0]['hits'])
+        pass
+
+    pass
+
+
 if __name__ == '__main__':
     main()
     pass
\ No newline at end of file
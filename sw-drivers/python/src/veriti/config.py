@@ -9,30 +9,55 @@ LOG_TIMESTAMP_R_TOKEN = ']'
 LOG_CAUSE_L_TOKEN = '\"'
 LOG_CAUSE_R_TOKEN = '\"'
 
+import contextvars as _contextvars
+import threading as _threading
+
+# the session activated in the current thread or context (if any)
+_active_session = _contextvars.ContextVar('veriti_session', default=None)
+
 
 class Config:
     '''
-    Implements the Singleton pattern for library-wide state and settings.
+    Implements the Singleton pattern for the state and settings of the active 
+    session. Outside of an explicit `Session`, every call returns the same 
+    library-wide instance.
     '''
-    _instance = None
 
     _LOG_FILE_EXT = '.log'
     _TRACE_FILE_EXT = '.trace'
     _COV_FILE_EXT = '.txt'
+    _COV_DB_EXT = '.json'
 
     _initialized = False
     _gens = dict()
     _ports = []
+    # map each port name to its index in the list of ports
+    _port_index = dict()
+    # incremented every time the ports are updated to invalidate compiled port plans
+    _ports_version = 0
+    # the last version given to any instance so versions are never reused across sessions
+    _last_ports_version = 0
+    _ports_version_lock = _threading.Lock()
     _seed = None
     _working_dir = '.'
     _sim_log = 'events' + _LOG_FILE_EXT
     _cov_report = 'coverage' + _COV_FILE_EXT
+    _cov_db = 'coverage' + _COV_DB_EXT
 
     def __new__(cls):
-        if cls._instance is None:
-            # print('Initializing library...')
-            cls._instance = super(Config, cls).__new__(cls)
-        return cls._instance
+        return get_session()._config
+    
+
+    @staticmethod
+    def _create():
+        '''
+        Creates a new instance with its own copy of the mutable settings.
+        '''
+        state = super(Config, Config).__new__(Config)
+        state._gens = dict()
+        state._ports = []
+        state._port_index = dict()
+        return state
     
 
     def read_bench_if(self, data: str):
@@ -49,9 +74,17 @@ class Config:
         # updates the ports
         data = json.loads(data)
         self._ports = []
+        self._port_index = dict()
         # store the ports
         for port in data['ports']:
+            # only remember the first port with a given name
+            if port['name'] not in self._port_index:
+                self._port_index[port['name']] = len(self._ports)
             self._ports += [port]
+        # sessions in other threads may read interface data at the same time
+        with Config._ports_version_lock:
+            Config._last_ports_version += 1
+            self._ports_version = Config._last_ports_version
         pass
 
 
@@ -66,10 +99,7 @@ class Config:
         '''
         Finds the first index that has a port with a name equal to `key`.
         '''
-        for (i, port) in enumerate(self._ports):
-            if port['name'] == key:
-                return i
-        return -1
+        return self._port_index.get(key, -1)
     
 
     def get_port(self, i: int) -> dict:
@@ -93,10 +123,128 @@ class Config:
         test generation.
         '''
         return self._cov_report
+    
+
+    def get_cov_db(self) -> str:
+        '''
+        Access the file name of the coverage database used to save the coverage bin counts 
+        during test generation.
+        '''
+        return self._cov_db
     pass
 
 
-def set(design_if: str=None, bench_if: str=None, work_dir: str=None, seed: int=None, generics=[], sim_log: str=None, cov_report: str=None):
+class Session:
+    '''
+    Owns the state of a test generation: the configuration (ports, generics, and 
+    seed), the random number generator, and the coverage nets with their counters.
+
+    Entering a session with `with` activates it for the current thread or context,
+    so two models or configurations can be generated in one process. Outside of any
+    session, the library uses a default session that draws from Python's `random` 
+    module.
+    '''
+
+    def __init__(self, seed: int=None, rng=None):
+        '''
+        Create a new Session instance.
+
+        ### Parameters
+        - The `seed` parameter sets the seed for the session and its random number generator.
+        - The `rng` parameter is the random number generator to draw from. If omitted, a new `random.Random` 
+        instance is created from the `seed`.
+        '''
+        import random
+        self._config = Config._create()
+        self._config._seed = seed
+        self._rng = rng if rng != None else random.Random(seed)
+        self._tokens = []
+        # the bin counts shared with other processes (if any)
+        self._shared = None
+        self.reset()
+        pass
+
+
+    def reset(self):
+        '''
+        Removes every coverage net and clears the coverage counters. The configuration
+        and any shared coverage are kept, so the nets created afterward are shared too.
+        '''
+        # detach the nets created before the reset from the running tally of failing nets
+        for net in getattr(self, '_nets', []):
+            net._tracked = False
+        # the coverage nets registered in this session
+        self._nets = []
+        # the number of calls to `Coverage.all_passed(...)` that were not passing
+        self._counter = 0
+        # number of nets that are not bypassed and have not met their goal
+        self._unmet_nets = 0
+        # the inputs found by the 'search' strategy to progress each net
+        self._found = dict()
+        return self
+    
+
+    def get_config(self) -> Config:
+        '''
+        Accesses the configuration owned by this session.
+        '''
+        return self._config
+    
+
+    def get_rng(self):
+        '''
+        Accesses the random number generator owned by this session.
+        '''
+        return self._rng
+    
+
+    def get_nets(self):
+        '''
+        Returns the list of coverage nets registered in this session.
+        '''
+        return self._nets
+    
+
+    def __enter__(self):
+        self._tokens += [_active_session.set(self)]
+        return self
+    
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _active_session.reset(self._tokens.pop())
+        pass
+
+    pass
+
+
+# the session used when no other session is active (created on first use)
+_default_session = None
+
+
+def get_session() -> Session:
+    '''
+    Returns the active session, or the library-wide default session when no
+    session is active.
+    '''
+    global _default_session
+    session = _active_session.get()
+    if session != None:
+        return session
+    if _default_session == None:
+        import random
+        # draw from the random module so seeding it stays reproducible
+        _default_session = Session(rng=random)
+    return _default_session
+
+
+def get_rng():
+    '''
+    Accesses the random number generator of the active session.
+    '''
+    return get_session()._rng
+
+
+def set(design_if: str=None, bench_if: str=None, work_dir: str=None, seed: int=None, generics=[], sim_log: str=None, cov_report: str=None, cov_db: str=None):
     # grab singleton object
     state = Config()
 
@@ -115,6 +263,8 @@ def set(design_if: str=None, bench_if: str=None, work_dir: str=None, seed: int=N
         state._sim_log = str(sim_log)
     if cov_report != None:
         state._cov_report = str(cov_report)
+    if cov_db != None:
+        state._cov_db = str(cov_db)
 
     # update to generics mapping
     for g in generics:
@@ -175,5 +325,7 @@ def rng_seed(default: int=None) -> int:
     # set the seed value
     if Config()._seed == None:
         Config()._seed = random.randrange(sys.maxsize)
-    # initialize the random state
+    # initialize the random state of a session that owns its own generator
+    if get_rng() is not random:
+        get_rng().seed(Config()._seed)
     return Config()._seed
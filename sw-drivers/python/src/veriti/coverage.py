@@ -9,6 +9,7 @@
 
 from abc import ABC as _ABC
 from enum import Enum as _Enum
+from . import config
 
 def _find_longest_str_len(x) -> int:
     '''
@@ -21,6 +22,123 @@ def _find_longest_str_len(x) -> int:
     return longest
 
 
+def _batch_view(item, vectors: list):
+    '''
+    Replaces every SignalVector found in `item` (including within nested lists and
+    tuples) with the handle to its current row. Each SignalVector found is added
+    to `vectors`.
+    '''
+    from .model import SignalVector
+
+    if isinstance(item, SignalVector) == True:
+        vectors += [item]
+        return item.row(0)
+    elif isinstance(item, (list, tuple)) == True:
+        return type(item)([_batch_view(x, vectors) for x in item])
+    return item
+
+
+def _transform_many(fn, values):
+    '''
+    Converts every item in `values` into an integer, applying the cover function 
+    `fn` first when it is defined.
+
+    When numpy is installed and `values` is a 1-dimensional array of integers, `fn`
+    is applied once to the entire array. If `fn` does not return an integer array
+    of the same length, it is applied to each value instead. Returns a numpy int64
+    array when the integers fit in 64 bits, otherwise returns a list.
+    '''
+    from .model import _import_numpy
+
+    np = _import_numpy()
+    if np != None:
+        try:
+            mapped = np.asarray(values)
+            if mapped.ndim == 1 and mapped.dtype.kind in 'iub' and fn != None:
+                mapped = np.asarray(fn(mapped))
+            if mapped.shape == (len(values),) and mapped.dtype.kind in 'iub':
+                # unsigned 64-bit values may not fit in a signed 64-bit integer
+                if mapped.dtype.kind != 'u' or mapped.dtype.itemsize < 8 or len(mapped) == 0 or int(mapped.max()) < 2**63:
+                    return mapped.astype(np.int64)
+        except Exception:
+            # the cover function only accepts a single item at a time
+            pass
+    return [int(v) if fn == None else int(fn(v)) for v in values]
+
+
+def _histogram(mapped):
+    '''
+    Counts the occurrences of each distinct integer in `mapped`.
+
+    Returns a list of tuples storing (integer, count).
+    '''
+    if type(mapped) == list:
+        counts = dict()
+        for x in mapped:
+            counts[x] = counts.get(x, 0) + 1
+        return list(counts.items())
+    from .model import _import_numpy
+    (uniques, counts) = _import_numpy().unique(mapped, return_counts=True)
+    return list(zip(uniques.tolist(), counts.tolist()))
+
+
+class _UnmetBins:
+    '''
+    An indexable set of the bin indices that have not yet met their goal.
+
+    Removing a bin and selecting a random bin are both constant-time operations.
+    '''
+
+    def __init__(self, n: int):
+        # the unmet bin indices in no particular order
+        self._items = list(range(n))
+        # the position of each bin index within `_items` (-1 once removed)
+        self._pos = list(range(n))
+        # the lowest bin index that may still be unmet
+        self._first = 0
+        pass
+
+
+    def __len__(self) -> int:
+        return len(self._items)
+    
+
+    def __contains__(self, i: int) -> bool:
+        return self._pos[i] >= 0
+
+
+    def remove(self, i: int):
+        '''
+        Removes the bin index `i` by swapping it with the last element.
+        '''
+        j = self._pos[i]
+        last = self._items.pop()
+        if last != i:
+            self._items[j] = last
+            self._pos[last] = j
+        self._pos[i] = -1
+        pass
+
+
+    def choice(self) -> int:
+        '''
+        Returns a random unmet bin index.
+        '''
+        return self._items[config.get_rng().randrange(len(self._items))]
+    
+
+    def first(self) -> int:
+        '''
+        Returns the lowest unmet bin index.
+        '''
+        # bins never become unmet again, so the search never moves backward
+        while self._pos[self._first] < 0:
+            self._first += 1
+        return self._first
+    
+    pass
+
+
 class Status(_Enum):
     PASSED = 0
     SKIPPED = 1
@@ -28,6 +146,202 @@ class Status(_Enum):
     pass
 
 
+class Retention(_Enum):
+    ALL = 0
+    NONE = 1
+    TOP_K = 2
+    RESERVOIR = 3
+
+    @staticmethod
+    def from_str(s: str):
+        s = s.lower()
+        if s == 'all':
+            return Retention.ALL
+        elif s == 'none':
+            return Retention.NONE
+        elif s == 'top-k' or s == 'topk':
+            return Retention.TOP_K
+        elif s == 'reservoir':
+            return Retention.RESERVOIR
+        else:
+            raise Exception('Failed to convert str '+s+' to type Retention')
+    pass
+
+
+class _Details:
+    '''
+    Retains the values that were covered for each bin according to a retention
+    policy.
+
+    - `ALL`: counts every distinct value (unbounded)
+    - `NONE`: stores nothing
+    - `TOP_K`: counts at most `size` values per bin using the space-saving algorithm, 
+    where counts of replaced values are over-estimates
+    - `RESERVOIR`: keeps a uniform random sample of at most `size` values per bin
+    '''
+
+    def __init__(self, policy, size: int=20):
+        self._policy = policy if isinstance(policy, str) == False else Retention.from_str(policy)
+        self._size = size
+        # map each bin index to its retained data
+        self._bins = dict()
+        # map each bin index to the number of values seen (reservoir only)
+        self._seen = dict()
+        pass
+
+
+    def record(self, i: int, value, count: int=1):
+        '''
+        Retains the `value` that was covered `count` times for the bin at index `i`.
+        '''
+        if self._policy == Retention.NONE:
+            return
+        if self._policy == Retention.RESERVOIR:
+            if i not in self._bins:
+                self._bins[i] = []
+                self._seen[i] = 0
+            sample = self._bins[i]
+            for _ in range(count):
+                self._seen[i] += 1
+                if len(sample) < self._size:
+                    sample += [value]
+                else:
+                    j = config.get_rng().randrange(self._seen[i])
+                    if j < self._size:
+                        sample[j] = value
+            return
+        if i not in self._bins:
+            self._bins[i] = dict()
+        counts = self._bins[i]
+        if value in counts:
+            counts[value] += count
+        elif self._policy == Retention.ALL or len(counts) < self._size:
+            counts[value] = count
+        else:
+            # replace the least frequent value and inherit its count
+            victim = min(counts, key=counts.get)
+            counts[value] = counts.pop(victim) + count
+        pass
+
+
+    def __contains__(self, i: int) -> bool:
+        return i in self._bins
+    
+
+    def get(self, i: int) -> dict:
+        '''
+        Returns a mapping of the retained values to their counts for the bin at index `i`.
+        '''
+        if self._policy == Retention.RESERVOIR:
+            counts = dict()
+            for value in self._bins[i]:
+                counts[value] = counts.get(value, 0) + 1
+            return counts
+        return self._bins[i]
+
+    pass
+
+
+class _InverseMap:
+    '''
+    Maps the bins of a net with a `cover` function back to source values that
+    reach them, so the net can be advanced without a hand-written `advance` function.
+
+    When the net reads the same signals it writes and those signals are narrow
+    enough, every source value is enumerated once to build the preimages of each
+    bin. Otherwise, the source values seen while covering each bin are kept as
+    witnesses to replay.
+    '''
+
+    # maximum number of source bits to enumerate
+    MAX_BITS = 16
+    # maximum number of witnesses kept per bin
+    MAX_WITNESSES = 8
+
+    def __init__(self, net):
+        from .model import Signal
+
+        self._net = net
+        self._sources = net.get_source_list()
+        # a net can only be enumerated offline if its sink is its source
+        is_same = [id(s) for s in net.get_sink_list()] == [id(s) for s in self._sources]
+        is_signal = all([isinstance(s, Signal) for s in self._sources])
+        self._enumerable = is_same == True and is_signal == True and sum([s.get_width() for s in self._sources]) <= self.MAX_BITS
+        # the source values that reach each bin (computed lazily)
+        self._preimages = None
+        # the source values observed for each bin
+        self._witnesses = dict()
+        pass
+
+
+    def _compile(self):
+        '''
+        Enumerates every source value through the net's `cover` function and
+        stores the preimages of each bin.
+        '''
+        import itertools
+        from .model import Signal
+
+        # mirror the sink with detached signals so the real signals keep their values
+        probes = [Signal(width=s.get_width(), endianness='big' if s._big_endian == True else 'little') for s in self._sources]
+        sink = self._net.get_sink()
+        probe = probes[0] if isinstance(sink, Signal) == True else type(sink)(probes)
+        self._preimages = dict()
+        for values in itertools.product(*[range(s.min(), s.max()+1) for s in self._sources]):
+            for (p, v) in zip(probes, values):
+                p._value = v
+            index = self._net._locate(self._net._transform(probe))
+            if index != None:
+                self._preimages.setdefault(index, []).append(values)
+            pass
+        pass
+
+
+    def record(self, index: int):
+        '''
+        Keeps the current source values as a witness for the bin at `index`.
+        '''
+        if self._enumerable == True:
+            return
+        values = tuple([int(s) for s in self._sources])
+        witnesses = self._witnesses.setdefault(index, [])
+        if len(witnesses) < self.MAX_WITNESSES and values not in witnesses:
+            witnesses.append(values)
+        pass
+
+
+    def _get_pool(self, index: int) -> list:
+        if self._enumerable == False:
+            return self._witnesses.get(index, [])
+        if self._preimages == None:
+            self._compile()
+        return self._preimages.get(index, [])
+
+
+    def advance(self, rand: bool=False):
+        '''
+        Returns the source values for an unmet bin that can be reached, or `None`
+        if no unmet bin has a known preimage.
+        '''
+        reachable = [i for i in self._net._get_unmet_bins() if len(self._get_pool(i)) > 0]
+        if len(reachable) == 0:
+            return None
+        return self.sample(config.get_rng().choice(reachable) if rand == True else min(reachable), rand)
+
+
+    def sample(self, index: int, rand: bool=False):
+        '''
+        Returns source values that reach the bin at `index`, or `None` if none are known.
+        '''
+        pool = self._get_pool(index)
+        if len(pool) == 0:
+            return None
+        values = config.get_rng().choice(pool) if rand == True else pool[0]
+        return values[0] if len(values) == 1 else list(values)
+
+    pass
+
+
 class Coverage:
 
     _total_coverages = 0
@@ -45,15 +359,17 @@ class Coverage:
         `True` once all cases are covered.
         '''
         # force the simulation to pass if enough checks are evaluated
-        if timeout > 0 and CoverageNet._counter >= timeout:
+        session = config.get_session()
+        if timeout > 0 and session._counter >= timeout:
             return True        
-        # check every cover-node
-        cov: CoverageNet
-        for cov in CoverageNet._group:
-            if cov.skipped() == False and cov.passed() == False:
-                # increment the counter
-                CoverageNet._counter += 1
-                return False
+        # include the bins met by the other processes sharing coverage
+        if session._shared != None:
+            session._shared.sync()
+        # the nets keep a running tally of how many are still failing
+        if session._unmet_nets > 0:
+            # increment the counter
+            session._counter += 1
+            return False
         return True
 
 
@@ -62,7 +378,7 @@ class Coverage:
         '''
         Returns the list of all coverage nets being tracked.
         '''
-        return CoverageNet._group
+        return config.get_session()._nets
     
 
     @staticmethod
@@ -74,7 +390,7 @@ class Coverage:
         '''
         net: CoverageNet
         result = []
-        for net in CoverageNet._group:
+        for net in config.get_session()._nets:
             # only append nets that are not bypassed and are not completed
             if net.skipped() == False and net.passed() == False:
                 result += [net]
@@ -90,7 +406,7 @@ class Coverage:
         '''
         contents = ''
         cov: CoverageNet
-        for cov in CoverageNet._group:
+        for cov in config.get_session()._nets:
             contents += cov.log(verbose) + '\n'
         return contents
 
@@ -108,7 +424,7 @@ class Coverage:
         a sense of how many test cases were required in order to achieve full
         coverage.
         '''
-        return CoverageNet._counter
+        return config.get_session()._counter
     
 
     @staticmethod
@@ -121,7 +437,7 @@ class Coverage:
         Coverage._goals_met = 0
         Coverage._total_points = 0
         net: CoverageNet
-        for net in CoverageNet._group:
+        for net in config.get_session()._nets:
             if net.status() == Status.SKIPPED:
                 continue
             Coverage._total_coverages += 1
@@ -150,6 +466,54 @@ class Coverage:
         passed = Coverage._goals_met
         total = Coverage._total_points
         return round((passed/total) * 100.0, 2) if total > 0 else None
+    
+
+    @staticmethod
+    def save(path: str=None) -> str:
+        '''
+        Writes the bin counts of every coverage net to a coverage database and
+        returns the absolute path to the file.
+
+        If `path` is omitted, the database is saved to the working directory.
+        '''
+        import os
+        from . import config
+
+        if path == None:
+            path = os.path.join(config.Config()._working_dir, config.Config().get_cov_db())
+        CoverageDB.from_nets().write(path)
+        return os.path.abspath(path)
+    
+
+    @staticmethod
+    def share(name: str, workers: int, worker: int, capacity: int=None, interval: int=None):
+        '''
+        Shares the bin counts of every coverage net with the other processes attached
+        to the shared memory segment `name`, so a net meets its goal once the processes
+        together meet it.
+
+        ### Parameters
+        - `name`: the name of the shared memory segment created by `SharedCoverage.create(...)`
+        - `workers`: the number of processes sharing the segment
+        - `worker`: this process's index from 0 to `workers`-1
+        - `capacity`: the maximum number of bins per process (must match the segment)
+        - `interval`: the number of calls to `all_passed(...)` between each exchange of counts (defaults to 4)
+        '''
+        shared = SharedCoverage(name, workers, worker, capacity=capacity, interval=interval)
+        config.get_session()._shared = shared
+        return shared
+
+
+    @staticmethod
+    def load(path: str) -> int:
+        '''
+        Adds the bin counts stored in the coverage database at `path` to the
+        matching coverage nets being tracked.
+
+        A net matches an entry in the database when they share the same name, type,
+        and number of bins. Returns the number of nets that were updated.
+        '''
+        return CoverageDB.read(path).apply()
     pass
 
 
@@ -181,6 +545,425 @@ def get_coverage_report_path() -> str:
     return os.path.abspath(path)
 
 
+class CoverageDB:
+    '''
+    A machine-readable record of the bin counts for each coverage net across one
+    or more runs.
+
+    Databases from different seeds, generics, or machines can be merged by summing
+    the bin counts of nets sharing the same name, type, and number of bins. The
+    values retained for the verbose report are not stored.
+    '''
+    FORMAT = 'veriti-coverage'
+    VERSION = 1
+
+    def __init__(self, nets=None, runs=None):
+        # store the entries for each net as dictionaries in the order they were registered
+        self._nets = nets if nets != None else []
+        # store an entry for the seed, iterations, and generics of every run
+        self._runs = runs if runs != None else []
+        pass
+
+
+    @staticmethod
+    def _key(entry: dict, seen: dict):
+        '''
+        Returns the key to identify the net `entry` when merging, counting repeated
+        keys in `seen` to tell apart nets that share the same name.
+        '''
+        key = (entry['name'], entry['type'], entry['bins'])
+        seen[key] = seen.get(key, -1) + 1
+        return key + (seen[key],)
+
+
+    @staticmethod
+    def from_nets():
+        '''
+        Captures the bin counts of every coverage net being tracked into a new database.
+        '''
+        from . import config
+
+        net: CoverageNet
+        nets = []
+        for net in config.get_session()._nets:
+            nets += [{
+                'name': net._name,
+                'type': type(net).__name__,
+                'goal': net._get_goal(),
+                'bypass': net.skipped(),
+                'bins': net._get_bin_count(),
+                'hits': [[i, k] for (i, k) in net._get_hits()],
+            }]
+        run = {
+            'seed': config.Config()._seed,
+            'iterations': Coverage.count(),
+            'generics': dict(config.Config()._gens),
+        }
+        return CoverageDB(nets, [run])
+    
+
+    @staticmethod
+    def read(path: str):
+        '''
+        Reads the coverage database saved at `path`.
+        '''
+        import json
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if data.get('format') != CoverageDB.FORMAT:
+            raise Exception('File '+str(path)+' is not a coverage database')
+        if data.get('version') != CoverageDB.VERSION:
+            raise Exception('Unsupported coverage database version '+str(data.get('version'))+' in file '+str(path))
+        return CoverageDB(data['nets'], data['runs'])
+    
+
+    def write(self, path: str):
+        '''
+        Saves the database to the file at `path`.
+        '''
+        import json, os
+        
+        dir = os.path.dirname(path)
+        if dir != '':
+            os.makedirs(dir, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({'format': CoverageDB.FORMAT, 'version': CoverageDB.VERSION, 'runs': self._runs, 'nets': self._nets}, f, separators=(',', ':'))
+        return self
+    
+
+    def merge(self, other):
+        '''
+        Sums the bin counts from the `other` database into this database.
+
+        Nets found only in `other` are appended to this database.
+        '''
+        seen = dict()
+        entries = dict()
+        for entry in self._nets:
+            entries[CoverageDB._key(entry, seen)] = entry
+        seen = dict()
+        for entry in other._nets:
+            key = CoverageDB._key(entry, seen)
+            if key not in entries:
+                entry = dict(entry, hits=[list(h) for h in entry['hits']])
+                entries[key] = entry
+                self._nets += [entry]
+                continue
+            counts = dict([(i, k) for (i, k) in entries[key]['hits']])
+            for (i, k) in entry['hits']:
+                counts[i] = counts.get(i, 0) + k
+            entries[key]['hits'] = [[i, k] for (i, k) in sorted(counts.items())]
+            pass
+        self._runs += other._runs
+        return self
+    
+
+    def apply(self) -> int:
+        '''
+        Adds the bin counts in this database to the matching coverage nets being tracked.
+
+        Returns the number of nets that were updated.
+        '''
+        net: CoverageNet
+        entries = dict()
+        seen = dict()
+        for entry in self._nets:
+            entries[CoverageDB._key(entry, seen)] = entry
+        updated = 0
+        seen = dict()
+        for net in list(config.get_session()._nets):
+            key = CoverageDB._key({'name': net._name, 'type': type(net).__name__, 'bins': net._get_bin_count()}, seen)
+            if key in entries:
+                net._load_hits([(i, k) for (i, k) in entries[key]['hits']])
+                updated += 1
+            pass
+        return updated
+    
+
+    def get_met_bins(self) -> set:
+        '''
+        Returns the set of tuples storing (net key, bin index) for every bin that
+        met its goal.
+        '''
+        bins = set()
+        seen = dict()
+        for entry in self._nets:
+            key = CoverageDB._key(entry, seen)
+            bins |= set([(key, i) for (i, k) in entry['hits'] if k >= entry['goal']])
+        return bins
+    
+
+    def get_runs(self):
+        '''
+        Returns the list of runs (seed, iterations, and generics) recorded in the database.
+        '''
+        return self._runs
+    
+
+    def get_iterations(self) -> int:
+        '''
+        Returns the total number of iterations across every run.
+        '''
+        return sum([run['iterations'] for run in self._runs])
+
+
+    def get_points_met(self, entry: dict=None) -> int:
+        '''
+        Returns the number of bins that met their goal for the net `entry`, or for 
+        every net that is not bypassed when `entry` is omitted.
+        '''
+        if entry == None:
+            return sum([self.get_points_met(e) for e in self._nets if e['bypass'] == False])
+        # every bin of a net without a goal is met
+        if entry['goal'] <= 0:
+            return entry['bins']
+        return len([k for (_, k) in entry['hits'] if k >= entry['goal']])
+    
+
+    def get_total_points(self) -> int:
+        '''
+        Returns the number of bins for every net that is not bypassed.
+        '''
+        return sum([e['bins'] for e in self._nets if e['bypass'] == False])
+    
+
+    def percent(self) -> float:
+        '''
+        Return the percent of bins that met their goal, from 0.00 to 100.00 with 
+        rounding to 2 decimal places.
+        
+        Returns `None` if there are no bins to tally.
+        '''
+        total = self.get_total_points()
+        return round((self.get_points_met() / total) * 100.0, 2) if total > 0 else None
+    
+
+    def report(self) -> str:
+        '''
+        Compiles a summary of the number of bins that met their goal for each net.
+        '''
+        contents = ''
+        contents += 'Runs: ' + str(len(self._runs)) + '\n'
+        contents += 'Iterations: ' + str(self.get_iterations()) + '\n'
+        contents += 'Points covered: ' + str(self.get_points_met()) + '\n'
+        contents += 'Total points: ' + str(self.get_total_points()) + '\n'
+        contents += 'Coverage: ' + str(self.percent()) + ' %\n'
+        contents += '\n'
+        for entry in self._nets:
+            met = self.get_points_met(entry)
+            if entry['bypass'] == True:
+                status = Status.SKIPPED
+            elif met == entry['bins']:
+                status = Status.PASSED
+            else:
+                status = Status.FAILED
+            contents += entry['type'] + ': ' + entry['name'] + ': ' + str(met) + '/' + str(entry['bins']) + ' ...' + status.name + '\n'
+        return contents
+
+    pass
+
+
+class SharedCoverage:
+    '''
+    Bin counts shared between processes that chase the same coverage goals, stored
+    in a `multiprocessing.shared_memory` segment.
+
+    Each process owns a shard of the segment that only it writes, so no locking is
+    required. The processes must create the same coverage nets in the same order,
+    which holds when running the same model script and generics. A bin meets its 
+    goal once the sum of its counts across every shard reaches the goal. Sparse 
+    crosses and nets that do not fit within the remaining capacity are not shared.
+
+    Each exchange only publishes the bins that changed since the last exchange, and
+    only sums the shards for every unmet bin when another process published changes.
+    '''
+    DEFAULT_CAPACITY = 2**16
+    DEFAULT_INTERVAL = 4
+
+    def __init__(self, name: str, workers: int, worker: int=None, capacity: int=None, interval: int=None, create: bool=False):
+        self._workers = workers
+        self._worker = worker
+        self._capacity = capacity if capacity != None else SharedCoverage.DEFAULT_CAPACITY
+        # each shard stores a layout fingerprint and a generation followed by its bin counts
+        self._stride = 2 + self._capacity
+        self._shm = SharedCoverage._open(name, create, 8 * self._workers * self._stride)
+        if create == True:
+            self._shm.buf[:] = bytes(len(self._shm.buf))
+        self._counts = self._shm.buf.cast('q')
+        self._interval = interval if interval != None else SharedCoverage.DEFAULT_INTERVAL
+        self._calls = 0
+        # the number of times this process published changed counts
+        self._generation = 0
+        # the last generation read from each of the other shards
+        self._seen = dict()
+        # store tuples of (net, counter, offset) for each net in the order they were registered
+        self._layout = []
+        self._used = 0
+        # the session's list of coverage nets that was laid out
+        self._group = None
+        self._scanned = 0
+        self._fingerprint = 0
+        pass
+
+
+    @staticmethod
+    def create(workers: int, capacity: int=None):
+        '''
+        Allocates a new zeroed shared memory segment for `workers` processes. The 
+        owner must call `unlink()` once every process is done.
+        '''
+        import uuid
+        return SharedCoverage('veriti-' + uuid.uuid4().hex[:16], workers, capacity=capacity, create=True)
+    
+
+    @staticmethod
+    def _open(name: str, create: bool, size: int):
+        '''
+        Creates or attaches to a segment without letting any resource tracker destroy 
+        it on exit. The segment lives until the owner calls `unlink()`.
+        '''
+        from multiprocessing import shared_memory, resource_tracker
+        try:
+            return shared_memory.SharedMemory(name=name, create=create, size=size, track=False)
+        except TypeError:
+            # python versions before 3.13 always register the segment, so unregister this one
+            shm = shared_memory.SharedMemory(name=name, create=create, size=size)
+            resource_tracker.unregister(shm._name, 'shared_memory')
+            return shm
+        
+
+    def get_name(self) -> str:
+        '''
+        Returns the name of the shared memory segment.
+        '''
+        return self._shm.name
+    
+
+    def _update_layout(self):
+        '''
+        Assigns an offset into the shard for each net registered since the last update.
+        '''
+        import zlib
+
+        net: CoverageNet
+        group = config.get_session()._nets
+        # start over when the session was reset or another session is active
+        if group is not self._group:
+            base = self._worker * self._stride
+            self._shm.buf[8 * base:8 * (base + self._stride)] = bytes(8 * self._stride)
+            self._group = group
+            self._layout = []
+            self._used = 0
+            self._scanned = 0
+            self._fingerprint = 0
+            self._generation = 0
+            self._seen = dict()
+        if self._scanned == len(group):
+            return
+        for net in group[self._scanned:]:
+            if isinstance(net, CoverCross) == True and isinstance(net._inner, _SparseRange) == True:
+                continue
+            bins = net._get_bin_count()
+            # every process skips the same nets, so the layouts still match
+            if self._used + bins > self._capacity:
+                continue
+            # a cross counts its bins in its inner range
+            counter = net._inner if isinstance(net, CoverCross) == True else net
+            # publish the counts collected before the net was laid out
+            counter._changes = dict(net._get_hits())
+            self._layout += [(net, counter, self._used)]
+            self._used += bins
+            # only shards with the same sequence of nets can be summed together
+            key = net._name + '/' + type(net).__name__ + '/' + str(bins) + ';'
+            self._fingerprint = zlib.crc32(key.encode(), self._fingerprint)
+        self._scanned = len(group)
+        pass
+
+
+    def sync(self, force: bool=False):
+        '''
+        Publishes this process's changed bin counts and meets every bin whose sum of 
+        counts across the shards reaches its goal.
+
+        Counts are only exchanged every `interval` calls unless `force` is set.
+        '''
+        net: CoverageNet
+
+        self._calls += 1
+        if force == False and self._calls % self._interval != 0:
+            return
+        self._update_layout()
+        counts = self._counts
+        fingerprint = self._fingerprint + 1
+        base = self._worker * self._stride
+        # publish only the bins that changed since the last exchange
+        changed = []
+        for (net, counter, offset) in self._layout:
+            if len(counter._changes) > 0:
+                for (i, k) in counter._changes.items():
+                    counts[base + 2 + offset + i] = k
+                changed += [(counter, list(counter._changes.keys()))]
+                counter._changes.clear()
+            pass
+        counts[base] = fingerprint
+        if len(changed) > 0:
+            self._generation += 1
+            counts[base + 1] = self._generation
+        # sum the counts from the shards that have the same layout
+        peers = [w for w in range(self._workers) if counts[w * self._stride] == fingerprint]
+        generations = dict([(w, counts[w * self._stride + 1]) for w in peers if w != self._worker])
+        is_stale = generations != self._seen
+        self._seen = generations
+        # only this process's changed bins can be met when the other shards are unchanged
+        dirty = dict([(id(counter), keys) for (counter, keys) in changed])
+        if is_stale == False and len(dirty) == 0:
+            return
+        starts = [w * self._stride + 2 for w in peers]
+        for (net, counter, offset) in self._layout:
+            if net.skipped() == True or net.passed() == True:
+                continue
+            if is_stale == True:
+                bins = net._get_unmet_bins()
+            else:
+                bins = [i for i in dirty.get(id(counter), []) if i in counter._unmet_bins]
+            goal = net._get_goal()
+            for i in bins:
+                if sum([counts[p + offset + i] for p in starts]) >= goal:
+                    net._meet_shared(i)
+            pass
+        pass
+
+
+    def close(self):
+        '''
+        Detaches from the shared memory segment.
+        '''
+        self._counts.release()
+        self._shm.close()
+        pass
+
+
+    def unlink(self):
+        '''
+        Destroys the shared memory segment.
+        '''
+        from multiprocessing import resource_tracker
+        # python versions before 3.13 always unregister the segment when unlinking it
+        if hasattr(self._shm, '_track') == False:
+            resource_tracker.register(self._shm._name, 'shared_memory')
+        self._shm.unlink()
+        pass
+
+    pass
+
+
+def get_coverage_db_path() -> str:
+    '''
+    Saves the coverage database, and then returns the absolute path to the file.
+    '''
+    return Coverage.save()
+
+
 def report_score() -> str:
     '''
     Formats the score as a `str`.
@@ -211,9 +994,6 @@ class CoverageNet(_ABC):
     from abc import abstractmethod as _abstractmethod
     from .model import Signal, Mode
 
-    _group = []
-    _counter = 0
-
     def __init__(self, name: str, bypass: bool=False, target: Signal=None, source: Signal=None, sink: Signal=None):
         '''
         Initializes a CoverageNet object.
@@ -236,7 +1016,100 @@ class CoverageNet(_ABC):
         # remember the signal(s) that are read to check coverage
         self._sink = target if sink == None else sink
     
-        CoverageNet._group += [self]
+        # remember if this net counts toward the running tally of failing nets
+        self._tracked = True
+        # the bin counts changed since the last exchange with other processes (if shared)
+        self._changes = None
+        # the total number of counts still required for every bin to meet the goal
+        self._deficit = max(self._get_goal(), 0) * self._get_bin_count()
+        # register this net in the active session
+        self._session = config.get_session()
+        self._session._nets += [self]
+        if self.skipped() == False and self.passed() == False:
+            self._session._unmet_nets += 1
+        pass
+
+
+    def _meet_bin(self, index: int):
+        '''
+        Records that the bin at `index` has met its goal.
+
+        Subclasses track the bins below their goal in `_unmet_bins` and call
+        this function when a bin's count reaches the goal. Once the last bin 
+        is met, the net is removed from the running tally of failing nets.
+        '''
+        # the bin may have already been met by the counts shared from other processes
+        if index not in self._unmet_bins:
+            return
+        self._unmet_bins.remove(index)
+        if len(self._unmet_bins) == 0:
+            self._meet_net()
+        pass
+
+
+    def _on_count(self, index: int, before: int, count: int):
+        '''
+        Records that the bin at `index` changed its count from `before` to `count`.
+        '''
+        # only the counts up to the goal reduce the deficit
+        self._deficit -= min(count, self._goal) - min(before, self._goal)
+        if self._changes != None:
+            self._changes[index] = count
+        pass
+
+
+    def _untrack(self):
+        '''
+        Removes this net from its session's nets and the running tally of failing nets.
+        '''
+        if self in self._session._nets:
+            self._session._nets.remove(self)
+        if self.skipped() == False and self.passed() == False and self._tracked == True:
+            self._session._unmet_nets -= 1
+        self._tracked = False
+        pass
+
+
+    def _meet_net(self):
+        '''
+        Records that this net has met its goal in the running tally of failing nets.
+        '''
+        if self.skipped() == False and self._tracked == True:
+            self._session._unmet_nets -= 1
+            # a met net no longer counts toward the tally
+            self._tracked = False
+        pass
+
+
+    def _get_unmet_bins(self):
+        '''
+        Returns the indices of the bins that have not yet met their goal.
+        '''
+        return list(self._unmet_bins._items)
+    
+
+    def _get_bin_value(self, index: int, rand: bool=False):
+        '''
+        Returns the source value(s) that cover the bin at `index`, or `None` if 
+        none are known.
+        '''
+        span = self.get_range()
+        return span.start + (index * span.step)
+    
+
+    def _meet_shared(self, index: int):
+        '''
+        Records that the bin at `index` has met its goal from the counts shared 
+        across processes.
+
+        The bin's count is raised to the goal, so the bin no longer reports progress
+        and the deficit reflects the bins met by the other processes.
+        '''
+        before = self._get_count(index)
+        if before < self._goal:
+            self._set_count(index, self._goal)
+            self._on_count(index, before, self._goal)
+        self._meet_bin(index)
         pass
 
     
@@ -260,7 +1133,7 @@ class CoverageNet(_ABC):
         '''
         Returns an iterable object of the signals to be read for checking coverage.
         '''
-        from .model import Signal 
+        from .model import Signal, SignalVector
 
         if hasattr(self, '_sink_list') == True:
             return self._sink_list
@@ -268,7 +1141,7 @@ class CoverageNet(_ABC):
         self._sink_list = []
         if self.has_sink() == True:
             # transform single signal into a list
-            if type(self._sink) == Signal:
+            if isinstance(self._sink, Signal) == True or isinstance(self._sink, SignalVector) == True:
                 self._sink_list = [self._sink]
             else:
                 self._sink_list = list(self._sink)
@@ -281,7 +1154,7 @@ class CoverageNet(_ABC):
         '''
         Returns an iterable object of the signals to be written for advancing coverage.
         '''
-        from .model import Signal 
+        from .model import Signal, SignalVector
 
         if hasattr(self, '_source_list') == True:
             return self._source_list
@@ -289,7 +1162,7 @@ class CoverageNet(_ABC):
         self._source_list = []
         if self.has_source() == True:
             # transform single signal into a list
-            if type(self._source) == Signal:
+            if isinstance(self._source, Signal) == True or isinstance(self._source, SignalVector) == True:
                 self._source_list = [self._source]
             else:
                 self._source_list = list(self._source)
@@ -331,28 +1204,146 @@ class CoverageNet(_ABC):
     @_abstractmethod
     def is_in_sample_space(self, item) -> bool:
         '''
-        Checks if the `item` is in the defined sample space.
+        Checks if the `item` is in the defined sample space.
+        '''
+        pass
+    
+
+    @_abstractmethod
+    def _map_onto_range(self, item) -> int:
+        '''
+        Converts the `item` into a valid number within the defined range of possible values.
+        
+        If there is no possible mapping, return None.
+        '''
+        pass
+
+
+    @_abstractmethod
+    def cover(self, item) -> bool:
+        '''
+        This function accepts either a single object or an interable object that is
+        required to read to see if coverage proceeds toward its goal.
+
+        It can be thought of as the inverse function to `advance(...)`.
+        '''
+        pass
+
+
+    def _add_hits(self, counts, hits) -> int:
+        '''
+        Adds the number of hits to the count of each bin from the list of tuples 
+        storing (bin index, hits), meeting any bin that reaches the goal.
+
+        Returns the number of hits that got the coverage closer to its goal.
+        '''
+        progress = 0
+        for (i, k) in hits:
+            before = counts[i]
+            counts[i] = before + k
+            self._on_count(i, before, counts[i])
+            if before < self._goal:
+                progress += min(k, self._goal - before)
+                if before + k >= self._goal:
+                    self._meet_bin(i)
+            pass
+        return progress
+
+
+    def _get_bin_count(self) -> int:
+        '''
+        Returns the number of bins that each track a count toward the goal.
+        '''
+        return self.get_partition_count()
+    
+
+    def _get_goal(self) -> int:
+        '''
+        Returns the count each bin must reach to meet the goal.
+        '''
+        return self._goal
+
+
+    def _get_deficit(self) -> int:
+        '''
+        Returns the total number of counts still required for every bin to meet the goal.
+        '''
+        return self._deficit
+
+
+    @_abstractmethod
+    def _get_hits(self):
+        '''
+        Returns a list of tuples storing (bin index, count) for every bin covered at least once.
+        '''
+        pass
+
+
+    @_abstractmethod
+    def _get_count(self, index: int) -> int:
+        '''
+        Returns the count of the bin at `index`.
+        '''
+        pass
+
+
+    @_abstractmethod
+    def _set_count(self, index: int, count: int):
+        '''
+        Overwrites the count of the bin at `index` without meeting the bin.
+        '''
+        pass
+
+
+    @_abstractmethod
+    def _load_hits(self, hits) -> int:
+        '''
+        Adds the counts from the list of tuples storing (bin index, count) to the bins.
+
+        Returns the number of counts that got the coverage closer to its goal.
+        '''
+        pass
+
+
+    def cover_many(self, values) -> int:
+        '''
+        Covers every item in `values`, as if `cover(...)` was called once per item.
+
+        Returns the number of items that got the coverage closer to its goal.
         '''
-        pass
-    
+        return sum([1 for item in values if self.cover(item) == True])
 
-    @_abstractmethod
-    def _map_onto_range(self, item) -> int:
+
+    def cover_batch(self, item) -> int:
         '''
-        Converts the `item` into a valid number within the defined range of possible values.
-        
-        If there is no possible mapping, return None.
+        Covers every transaction held by the SignalVector(s) in `item`, as if `cover(...)`
+        was called once per row. Signals in `item` keep the same value for every row.
+
+        Returns the number of rows for which `cover(...)` returned `True`.
         '''
-        pass
+        vectors = []
+        view = _batch_view(item, vectors)
+        rows = len(vectors[0]) if len(vectors) > 0 else 1
+        for vec in vectors:
+            if len(vec) != rows:
+                raise Exception('Cannot cover SignalVectors with different numbers of transactions')
+        progress = 0
+        for i in range(rows):
+            for vec in vectors:
+                vec._cursor = i
+            if self.cover(view) == True:
+                progress += 1
+            pass
+        return progress
 
 
     @_abstractmethod
-    def cover(self, item) -> bool:
+    def would_progress(self, item) -> bool:
         '''
-        This function accepts either a single object or an interable object that is
-        required to read to see if coverage proceeds toward its goal.
-
-        It can be thought of as the inverse function to `advance(...)`.
+        Checks if covering the `item` would get the coverage closer to its goal, without
+        changing any counts. 
+        
+        This is the side-effect free query to `cover(...)`.
         '''
         pass
 
@@ -452,6 +1443,8 @@ class CoverPoint(CoverageNet):
         '''
         self._count = 0
         self._goal = goal
+        # a point is a single bin that is unmet until the count reaches the goal
+        self._unmet_bins = _UnmetBins(1 if self._goal > 0 else 0)
         # define a custom function that should return a boolean to define the targeted point
         self._fn_cover = cover
         self._fn_advance = advance
@@ -487,7 +1480,7 @@ class CoverPoint(CoverageNet):
         '''
         Returns the number of points that have met their goal.
         '''
-        return 1 if self._count >= self._goal else 0
+        return 1 - len(self._unmet_bins)
 
 
     def cover(self, item):
@@ -500,15 +1493,65 @@ class CoverPoint(CoverageNet):
         cond = bool(self._map_onto_range(item))
         if cond == True:
             self._count += 1
+            self._on_count(0, self._count - 1, self._count)
+            if self._count == self._goal:
+                self._meet_bin(0)
         return cond
     
 
+    def would_progress(self, item) -> bool:
+        if self._count >= self._goal or self.is_in_sample_space(item) == False:
+            return False
+        return bool(self._map_onto_range(item))
+
+
+    def cover_many(self, values) -> int:
+        '''
+        Counts every item in `values` that satisfies the `cond` at once.
+
+        Returns the number of items that got the coverpoint closer to its goal.
+        '''
+        hits = sum([k for (x, k) in _histogram(_transform_many(self._fn_cover, values)) if x == 1])
+        return self._load_hits([(0, hits)])
+    
+
+    def _get_bin_count(self) -> int:
+        return 1
+
+
+    def _get_hits(self):
+        return [(0, self._count)] if self._count > 0 else []
+    
+
+    def _get_count(self, index: int) -> int:
+        return self._count
+    
+
+    def _set_count(self, index: int, count: int):
+        self._count = count
+        pass
+    
+
+    def _load_hits(self, hits) -> int:
+        progress = 0
+        for (_, k) in hits:
+            before = self._count
+            self._count += k
+            self._on_count(0, before, self._count)
+            if before < self._goal:
+                progress += min(k, self._goal - before)
+                if self._count >= self._goal:
+                    self._meet_bin(0)
+            pass
+        return progress
+
+
     def advance(self, rand=False):
         return int(True) if self._fn_advance == None else self._fn_advance(self._source)
 
 
     def passed(self):
-        return self._count >= self._goal
+        return len(self._unmet_bins) == 0
     
 
     def to_string(self, verbose: bool):
@@ -523,13 +1566,15 @@ class CoverGroup(CoverageNet):
 
     group = []
 
-    def __init__(self, name: str, bins: _List, goal: int=1, bypass: bool=False, max_bins=64, advance=None, cover=None, target: Signal=None, source: Signal=None, sink: Signal=None):
+    def __init__(self, name: str, bins: _List, goal: int=1, bypass: bool=False, max_bins=64, advance=None, cover=None, target: Signal=None, source: Signal=None, sink: Signal=None, details: Retention=Retention.ALL, max_details: int=20):
         '''
         Initialize a cover group object.
 
         ### Parameters
         - `advance`: a function or lambda expression that provides values to write to the source to advance coverage
         - `cover`: a function or lambda expression that provides a way to read values from a sink to check coverage
+        - `details`: the retention policy for the covered values shown in the verbose report ('all', 'none', 'top-k', or 'reservoir')
+        - `max_details`: the number of covered values retained per bin when `details` is 'top-k' or 'reservoir'
         '''
         # stores the items per index for each bin group
         self._macro_bins = []
@@ -544,7 +1589,7 @@ class CoverGroup(CoverageNet):
         self._max_bins = max_bins
 
         # store the actual values when mapped items cover toward the goal
-        self._mapped_items = dict()
+        self._mapped_items = _Details(details, max_details)
 
         # will need to provide a division operation step before inserting into
         if len(bins) > self._max_bins:
@@ -567,6 +1612,8 @@ class CoverGroup(CoverageNet):
 
         # set the goal required for each bin
         self._goal = goal
+        # track the number of bins that have not yet met the goal
+        self._unmet_bins = _UnmetBins(len(self._macro_bins_count) if self._goal > 0 else 0)
         # initialize the total count of all covers
         self._total_count = 0
 
@@ -576,6 +1623,8 @@ class CoverGroup(CoverageNet):
         self._fn_advance = advance
 
         super().__init__(name=name, bypass=bypass, target=target, source=source, sink=sink)
+        # map the bins back to source values when no inverse is provided
+        self._inverse = _InverseMap(self) if self._fn_cover != None and self._fn_advance == None and self.has_source() == True else None
         pass
 
 
@@ -609,6 +1658,15 @@ class CoverGroup(CoverageNet):
         return int(self._bins_lookup[item] / self._items_per_bin)
     
 
+    def _locate(self, mapped_item) -> int:
+        '''
+        Returns the macro index for the `mapped_item`, or `None` if it is not in any bin.
+        '''
+        if self._bins_lookup.get(mapped_item) == None:
+            return None
+        return self._get_macro_bin_index(mapped_item)
+    
+
     def cover(self, item):
         '''
         Return's true if it got the entire group closer to meeting coverage.
@@ -625,26 +1683,68 @@ class CoverGroup(CoverageNet):
         is_progress = self._macro_bins_count[i_macro] < self._goal
         # update the map with the value
         self._macro_bins_count[i_macro] += 1
+        self._on_count(i_macro, self._macro_bins_count[i_macro] - 1, self._macro_bins_count[i_macro])
+        if self._macro_bins_count[i_macro] == self._goal:
+            self._meet_bin(i_macro)
         # update the total count
         self._total_count += 1
         # record the actual value that initiated this coverage
         if self._fn_cover != None:
-            if i_macro not in self._mapped_items.keys():
-                self._mapped_items[i_macro] = dict()
-            if mapped_item not in self._mapped_items[i_macro].keys():
-                self._mapped_items[i_macro][mapped_item] = 0 
-            # increment the count of this item being detected
-            self._mapped_items[i_macro][mapped_item] += 1
+            self._mapped_items.record(i_macro, mapped_item)
             pass
+        # remember the source values that reached this bin
+        if self._inverse != None and item is self._sink:
+            self._inverse.record(i_macro)
         return is_progress
     
 
+    def would_progress(self, item) -> bool:
+        if self.is_in_sample_space(item) == False:
+            return False
+        return self._macro_bins_count[self._get_macro_bin_index(self._transform(item))] < self._goal
+
+
+    def cover_many(self, values) -> int:
+        '''
+        Bins every item in `values` at once.
+
+        Returns the number of items that got the group closer to its goal.
+        '''
+        hits = dict()
+        for (x, k) in _histogram(_transform_many(self._fn_cover, values)):
+            if self._bins_lookup.get(x) == None:
+                continue
+            i_macro = self._get_macro_bin_index(x)
+            hits[i_macro] = hits.get(i_macro, 0) + k
+            self._total_count += k
+            # record the actual values that initiated this coverage
+            if self._fn_cover != None:
+                self._mapped_items.record(i_macro, x, k)
+            pass
+        return self._add_hits(self._macro_bins_count, hits.items())
+    
+
+    def _get_hits(self):
+        return [(i, k) for (i, k) in enumerate(self._macro_bins_count) if k > 0]
+    
+
+    def _get_count(self, index: int) -> int:
+        return self._macro_bins_count[index]
+    
+
+    def _set_count(self, index: int, count: int):
+        self._macro_bins_count[index] = count
+        pass
+    
+
+    def _load_hits(self, hits) -> int:
+        hits = list(hits)
+        self._total_count += sum([k for (_, k) in hits])
+        return self._add_hits(self._macro_bins_count, hits)
+
+
     def get_points_met(self) -> int:
-        points_met = 0
-        for count in self._macro_bins_count:
-            if count >= self._goal:
-                points_met += 1
-        return points_met
+        return len(self._macro_bins_count) - len(self._unmet_bins)
     
 
     def advance(self, rand=False):
@@ -655,34 +1755,34 @@ class CoverGroup(CoverageNet):
         sequentially.
 
         Returns `None` if no item is left (all goals are reached and coverage is
-        passing).
+        passing). A net with a `cover` function and no `advance` function returns 
+        source values that map onto an unmet bin, or `None` if none are known yet.
         '''
-        import random as _random
-
-        # can only map 1-way (as of now)
-        if self._fn_cover != None and self._fn_advance == None:
-            raise Exception("Cannot map back to original values")
-
+        if len(self._unmet_bins) == 0:
+            return None
         if self._fn_advance != None:
-            raise Exception("Implement inverse mapping")
+            return self._fn_advance(self._source)
+        # search for the source values that map onto an unmet bin
+        if self._fn_cover != None:
+            if self._inverse == None:
+                raise Exception("Cannot map back to original values without a source")
+            return self._inverse.advance(rand)
         
-        available = []
-        # filter out the elements who have not yet met the goal
-        for i, count in enumerate(self._macro_bins_count):
-            if count < self._goal:
-                available += [i]
-            pass
-        if len(available) == 0:
-            return None
         if rand == True:
-            # pick a random macro bin
-            i_macro = _random.choice(available)
+            # pick a random macro bin that has not yet met the goal
+            i_macro = self._unmet_bins.choice()
             # select a random item from the bin
-            return _random.choice(self._macro_bins[i_macro])
+            return config.get_rng().choice(self._macro_bins[i_macro])
 
         # provide 1st available if random is disabled
-        i_macro = available[0]
+        i_macro = self._unmet_bins.first()
         return self._macro_bins[i_macro][0]
+    
+
+    def _get_bin_value(self, index: int, rand: bool=False):
+        if self._inverse != None:
+            return self._inverse.sample(index, rand)
+        return self._macro_bins[index][0]
 
     
     def passed(self) -> bool:
@@ -690,11 +1790,7 @@ class CoverGroup(CoverageNet):
         Checks if each bin within the `CoverGroup` has met or exceeded its goal. 
         If any of the bins has not, then whole function fails and returns `False`.
         '''
-        for val in self._macro_bins_count:
-            # fail on first failure
-            if val < self._goal:
-                return False
-        return True
+        return len(self._unmet_bins) == 0
     
 
     def _macro_to_string(self, i) -> str:
@@ -733,10 +1829,11 @@ class CoverGroup(CoverageNet):
                 count = self._macro_bins_count[i]
                 result += str(phrase) + ': ' + (' ' * (longest_len - len(str(phrase)))) + str(count) + '/' + str(self._goal)
                 # enumerate on all mapped values that were detected for this bin
-                if self._fn_cover != None and i in self._mapped_items.keys() and self.get_range().step > 1:
+                if self._fn_cover != None and i in self._mapped_items and self.get_range().step > 1:
                     # determine the string formatting by identifying longest string
-                    sub_longest_len = _find_longest_str_len(self._mapped_items[i].keys())
-                    seq = [(key, val) for key, val in self._mapped_items[i].items()]
+                    mapped_items = self._mapped_items.get(i)
+                    sub_longest_len = _find_longest_str_len(mapped_items.keys())
+                    seq = [(key, val) for key, val in mapped_items.items()]
                     seq.sort()
                     LIMITER = 20
                     for j, (key, val) in enumerate(seq):
@@ -750,12 +1847,7 @@ class CoverGroup(CoverageNet):
                 is_first = False
         # print the number of bins that reached their goal
         else:
-            bins_reached = 0
-            for count in self._macro_bins_count:
-                if count >= self._goal:
-                    bins_reached += 1
-                pass
-            result += str(bins_reached) + '/' + str(len(self._macro_bins_count))
+            result += str(self.get_points_met()) + '/' + str(len(self._macro_bins_count))
         return result
     pass
 
@@ -768,16 +1860,16 @@ class CoverRange(CoverageNet):
     '''
     from .model import Signal
 
-    def __init__(self, name: str, span: range, goal: int=1, bypass: bool=False, max_steps: int=64, advance=None, cover=None, target: Signal=None, source: Signal=None, sink: Signal=None):
+    def __init__(self, name: str, span: range, goal: int=1, bypass: bool=False, max_steps: int=64, advance=None, cover=None, target: Signal=None, source: Signal=None, sink: Signal=None, details: Retention=Retention.ALL, max_details: int=20):
         '''
         Initialize a cover range object. 
         
         ### Parameters
         - `advance`: a function or lambda expression that provides values to write to the source to advance coverage
         - `cover`: a function or lambda expression that provides a way to read values from a sink to check coverage
+        - `details`: the retention policy for the covered values shown in the verbose report ('all', 'none', 'top-k', or 'reservoir')
+        - `max_details`: the number of covered values retained per bin when `details` is 'top-k' or 'reservoir'
         '''
-        import math
-
         domain = span
         self._goal = goal
         # domain = range
@@ -790,12 +1882,15 @@ class CoverRange(CoverageNet):
         self._num_of_steps = num_steps_needed
         if self._max_steps != None and num_steps_needed > self._max_steps:
             # update instance attributes
-            self._step_size = int(math.ceil(abs(domain.start - domain.stop) / self._max_steps))
-            self._num_of_steps = self._max_steps
+            # use integer ceiling division so wide spans are not rounded as floats
+            self._step_size = -(-abs(domain.start - domain.stop) // self._max_steps)
+            # only keep the bins that intersect the span
+            self._num_of_steps = -(-abs(domain.start - domain.stop) // self._step_size)
             pass
 
-        self._table = [[]] * self._num_of_steps
         self._table_counts = [0] * self._num_of_steps
+        # track the number of bins that have not yet met the goal
+        self._unmet_bins = _UnmetBins(self._num_of_steps if self._goal > 0 else 0)
 
         self._start = domain.start
         self._stop = domain.stop
@@ -808,9 +1903,11 @@ class CoverRange(CoverageNet):
         self._fn_advance = advance
 
         # store the actual values when mapped items cover toward the goal
-        self._mapped_items = dict()
+        self._mapped_items = _Details(details, max_details)
 
         super().__init__(name=name, bypass=bypass, target=target, source=source, sink=sink)
+        # map the bins back to source values when no inverse is provided
+        self._inverse = _InverseMap(self) if self._fn_cover != None and self._fn_advance == None and self.has_source() == True else None
         pass
 
 
@@ -823,11 +1920,7 @@ class CoverRange(CoverageNet):
     
 
     def get_points_met(self) -> int:
-        points_met = 0
-        for entry in self._table_counts:
-            if entry >= self._goal:
-                points_met += 1
-        return points_met
+        return self._num_of_steps - len(self._unmet_bins)
     
 
     def passed(self) -> bool:
@@ -835,11 +1928,7 @@ class CoverRange(CoverageNet):
         Checks if each bin within the `CoverGroup` has met or exceeded its goal. 
         If any of the bins has not, then whole function fails and returns `False`.
         '''
-        for entry in self._table_counts:
-            # exit early on first failure for not meeting coverage goal
-            if entry < self._goal:
-                return False
-        return True
+        return len(self._unmet_bins) == 0
     
 
     def _transform(self, item):
@@ -855,6 +1944,15 @@ class CoverRange(CoverageNet):
         if self.is_in_sample_space(item) == False:
             return None
         return self._transform(item)
+    
+
+    def _locate(self, mapped_item) -> int:
+        '''
+        Returns the bin index for the `mapped_item`, or `None` if it is outside the span.
+        '''
+        if mapped_item < self._start or mapped_item >= self._stop:
+            return None
+        return (mapped_item - self._start) // self._step_size
 
 
     def cover(self, item) -> bool:
@@ -868,24 +1966,79 @@ class CoverRange(CoverageNet):
         # convert item to int
         mapped_item = self._transform(item)
         # transform into coverage domain
-        index = int(mapped_item / self._step_size)
+        index = self._locate(mapped_item)
         # check if it improves progessing by adding to a mapping that has not met the goal yet
         is_progress = self._table_counts[index] < self._goal
         # update the coverage for this value
-        self._table[index] += [mapped_item]
         self._table_counts[index] += 1
+        self._on_count(index, self._table_counts[index] - 1, self._table_counts[index])
+        if self._table_counts[index] == self._goal:
+            self._meet_bin(index)
         self._total_count += 1
         # track original items that count toward their space of the domain
-        if index not in self._mapped_items.keys():
-            self._mapped_items[index] = dict()
-        if item not in self._mapped_items[index].keys():
-            self._mapped_items[index][mapped_item] = 0 
-        # increment the count of this item being detected
-        self._mapped_items[index][mapped_item] += 1
-            
+        self._mapped_items.record(index, mapped_item)
+        # remember the source values that reached this bin
+        if self._inverse != None and item is self._sink:
+            self._inverse.record(index)
         return is_progress
     
 
+    def would_progress(self, item) -> bool:
+        if self.is_in_sample_space(item) == False:
+            return False
+        return self._table_counts[self._locate(self._transform(item))] < self._goal
+
+
+    def cover_many(self, values) -> int:
+        '''
+        Bins every item in `values` at once.
+
+        Returns the number of items that got the range closer to its goal.
+        '''
+        from .model import _import_numpy
+
+        mapped = _transform_many(self._fn_cover, values)
+        if type(mapped) == list:
+            mapped = [x for x in mapped if x >= self._start and x < self._stop]
+            hits = dict()
+            for x in mapped:
+                index = (x - self._start) // self._step_size
+                hits[index] = hits.get(index, 0) + 1
+            hits = hits.items()
+        else:
+            np = _import_numpy()
+            mapped = mapped[(mapped >= self._start) & (mapped < self._stop)]
+            # count the hits for every bin in one pass
+            counts = np.bincount((mapped - self._start) // self._step_size, minlength=self._num_of_steps)
+            touched = np.flatnonzero(counts)
+            hits = zip(touched.tolist(), counts[touched].tolist())
+        self._total_count += len(mapped)
+        # track original items that count toward their space of the domain
+        if self._mapped_items._policy != Retention.NONE:
+            for (x, k) in _histogram(mapped):
+                self._mapped_items.record((x - self._start) // self._step_size, x, k)
+        return self._add_hits(self._table_counts, hits)
+    
+
+    def _get_hits(self):
+        return [(i, k) for (i, k) in enumerate(self._table_counts) if k > 0]
+    
+
+    def _get_count(self, index: int) -> int:
+        return self._table_counts[index]
+    
+
+    def _set_count(self, index: int, count: int):
+        self._table_counts[index] = count
+        pass
+    
+
+    def _load_hits(self, hits) -> int:
+        hits = list(hits)
+        self._total_count += sum([k for (_, k) in hits])
+        return self._add_hits(self._table_counts, hits)
+    
+
     def advance(self, rand: bool=False):
         '''
         Returns the next item currently not meeting the coverage goal.
@@ -894,34 +2047,33 @@ class CoverRange(CoverageNet):
         sequentially.
 
         Returns `None` if no item is left (all goals are reached and coverage is
-        passing).
+        passing). A net with a `cover` function and no `advance` function returns 
+        source values that map onto an unmet bin, or `None` if none are known yet.
         '''
-        import random as _random
-
-        # can only map 1-way (as of now)
-        if self._fn_cover != None and self._fn_advance == None:
-            raise Exception("Cannot map back to original values")
-
+        if len(self._unmet_bins) == 0:
+            return None
         if self._fn_advance != None:
-            raise Exception("Implement")
+            return self._fn_advance(self._source)
+        # search for the source values that map onto an unmet bin
+        if self._fn_cover != None:
+            if self._inverse == None:
+                raise Exception("Cannot map back to original values without a source")
+            return self._inverse.advance(rand)
         
-        available = []
-        # filter out the elements who have not yet met the goal
-        for i, count in enumerate(self._table_counts):
-            if count < self._goal:
-                available += [i]
-            pass
-        if len(available) == 0:
-            return None
         if rand == True:
-            j = _random.choice(available)
-            # transform back to the selection of the expanded domain space
-            expanded_space = [(j * self._step_size) + x for x in range(0, self._step_size)]
-            # select a random item from the bin
-            return _random.choice(expanded_space)
+            j = self._unmet_bins.choice()
+            # transform back to the expanded domain space and select a random item from the bin
+            lower = self._start + (j * self._step_size)
+            upper = min(lower + self._step_size, self._stop)
+            return config.get_rng().randrange(lower, upper)
         # provide 1st available if random is disabled
-        expanded_space = [(available[0] * self._step_size) + x for x in range(0, self._step_size)]
-        return expanded_space[0]
+        return self._start + (self._unmet_bins.first() * self._step_size)
+    
+
+    def _get_bin_value(self, index: int, rand: bool=False):
+        if self._inverse != None:
+            return self._inverse.sample(index, rand)
+        return super()._get_bin_value(index, rand)
     
 
     def to_string(self, verbose: bool) -> str:
@@ -930,12 +2082,12 @@ class CoverRange(CoverageNet):
         if verbose == True:
             # determine the string formatting by identifying longest string
             if self._step_size > 1:
-                longest_len = len(str((len(self._table)-2) * self._step_size) + '..=' + str((len(self._table)-1) * self._step_size))
+                longest_len = len(str((self._num_of_steps-2) * self._step_size) + '..=' + str((self._num_of_steps-1) * self._step_size))
             else:
                 longest_len = len(str(self._stop-1))
             is_first = True
             # print the coverage analysis
-            for i, _group in enumerate(self._table):
+            for i in range(self._num_of_steps):
                 if is_first == False:
                     result += '\n    '
                 if self._step_size > 1:
@@ -945,9 +2097,10 @@ class CoverRange(CoverageNet):
                 count = self._table_counts[i]
                 result += str(step) + ': ' + (' ' * (longest_len - len(str(step)))) + str(count) + '/' + str(self._goal)
                 # determine the string formatting by identifying longest string
-                if self._step_size > 1 and i in self._mapped_items.keys():
-                    sub_longest_len = _find_longest_str_len(self._mapped_items[i].keys())
-                    seq = [(key, val) for key, val in self._mapped_items[i].items()]
+                if self._step_size > 1 and i in self._mapped_items:
+                    mapped_items = self._mapped_items.get(i)
+                    sub_longest_len = _find_longest_str_len(mapped_items.keys())
+                    seq = [(key, val) for key, val in mapped_items.items()]
                     seq.sort()
                     LIMITER = 20
                     for i, (key, val) in enumerate(seq):
@@ -961,13 +2114,147 @@ class CoverRange(CoverageNet):
             pass
         # print the number of bins that reached their goal
         else:
-            goals_reached = 0
-            for count in self._table_counts:
-                if count >= self._goal:
-                    goals_reached += 1
-                pass
-            result += str(goals_reached) + '/' + str(len(self._table_counts))
+            result += str(self.get_points_met()) + '/' + str(len(self._table_counts))
+        return result
+
+
+class _SparseRange:
+    '''
+    A sparse alternative to the CoverRange used internally by a CoverCross.
+
+    Only the indices that have been covered are stored, so the memory grows with 
+    the number of hit cells instead of the size of the entire span. Unmet cells
+    are found lazily when advancing.
+    '''
+
+    # number of random draws to attempt before scanning for an unmet cell
+    _MAX_DRAWS = 64
+
+    def __init__(self, span: range, goal: int=1):
+        from .model import _range_len
+
+        self._span = span
+        # store the number of cells since `len(...)` is limited to the size of a C integer
+        self._size = _range_len(span)
+        self._goal = goal
+        # store the count for each index that has been covered at least once
+        self._hits = dict()
+        # number of indices that have met the goal
+        self._met = self._size if self._goal <= 0 else 0
+        # the total number of counts still required for every cell to meet the goal
+        self._deficit = max(self._goal, 0) * self._size
+        # the lowest index that may still be unmet
+        self._first = 0
+        # initialize the total count of all covers
+        self._total_count = 0
+        pass
+
+
+    def get_range(self) -> range:
+        return self._span
+    
+
+    def get_partition_count(self) -> int:
+        return self._size
+    
+
+    def get_points_met(self) -> int:
+        return self._met
+    
+
+    def passed(self) -> bool:
+        return self._met == self._size
+    
+
+    def _is_met(self, index: int) -> bool:
+        return self._hits.get(index, 0) >= self._goal
+
+
+    def cover(self, index: int) -> bool:
+        count = self._hits.get(index, 0)
+        is_progress = count < self._goal
+        self._hits[index] = count + 1
+        if is_progress == True:
+            self._deficit -= 1
+        if count + 1 == self._goal:
+            self._met += 1
+        self._total_count += 1
+        return is_progress
+    
+
+    def would_progress(self, index: int) -> bool:
+        return self._is_met(index) == False
+
+
+    def cover_many(self, indices) -> int:
+        return self._load_hits(_histogram(indices))
+    
+
+    def _get_hits(self):
+        return sorted(self._hits.items())
+
+
+    def _load_hits(self, hits) -> int:
+        progress = 0
+        for (index, k) in hits:
+            count = self._hits.get(index, 0)
+            self._hits[index] = count + k
+            if count < self._goal:
+                progress += min(k, self._goal - count)
+                if count + k >= self._goal:
+                    self._met += 1
+            self._total_count += k
+        self._deficit -= progress
+        return progress
+    
+
+    def _scan(self, index: int) -> int:
+        '''
+        Returns the first unmet index at or after `index`, wrapping around the span.
+        '''
+        for i in range(index, self._size):
+            if self._is_met(i) == False:
+                return i
+        for i in range(0, index):
+            if self._is_met(i) == False:
+                return i
+        return None
+
+
+    def advance(self, rand: bool=False):
+        if self.passed() == True:
+            return None
+        if rand == True:
+            # draw randomly until landing on an unmet cell
+            for _ in range(self._MAX_DRAWS):
+                index = config.get_rng().randrange(self._size)
+                if self._is_met(index) == False:
+                    return index
+            # most cells are met, so walk from a random starting point
+            return self._scan(config.get_rng().randrange(self._size))
+        # met cells stay met, so the search never moves backward
+        while self._is_met(self._first) == True:
+            self._first += 1
+        return self._first
+    
+
+    def to_string(self, verbose: bool) -> str:
+        result = ''
+        # print each covered cell and its goal status
+        if verbose == True:
+            seq = sorted(self._hits.items())
+            longest_len = _find_longest_str_len([key for key, _ in seq])
+            for i, (key, val) in enumerate(seq):
+                if i > 0:
+                    result += '\n    '
+                result += str(key) + ': ' + (' ' * (longest_len - len(str(key)))) + str(val) + '/' + str(self._goal)
+            pass
+        # print the number of cells that reached their goal
+        else:
+            result += str(self._met) + '/' + str(self._size)
         return result
+    
+    pass
 
 
 class CoverCross(CoverageNet):
@@ -975,28 +2262,41 @@ class CoverCross(CoverageNet):
     CoverCrosses are designed to track cross products between two or more coverage nets.
 
     Internally, a CoverCross stores a CoverRange for the 1-dimensional flatten version of
-    the N-dimensional cross product across the different coverage nets.
+    the N-dimensional cross product across the different coverage nets. Enabling `sparse` 
+    only stores the cells of the cross product that were covered, which allows for 
+    cross products too large to allocate.
     '''
     from typing import List as _List
 
-    def __init__(self, name: str, nets: _List[CoverageNet], goal: int=1, bypass=False):
-        self._nets = nets[::-1]
+    def __init__(self, name: str, nets: _List[CoverageNet], goal: int=1, bypass=False, sparse: bool=False):
+        self._nets = list(nets)
         self._crosses = len(self._nets)
-        
+
+        # store each net's sample space to map between values and partitions
+        self._spans = [n.get_range() for n in self._nets]
+        # precompute the mixed-radix strides where the 0th net varies the fastest
+        self._strides = [1] * self._crosses
         combinations = 1
-        for n in nets:
+        for i, n in enumerate(self._nets):
+            self._strides[i] = combinations
             combinations *= n.get_partition_count()
             pass
 
-        self._inner = CoverRange(
-            name,
-            span=range(combinations),
-            goal=goal,
-            bypass=bypass,
-            max_steps=None,
-            cover=None,
-            advance=None,
-        )
+        if sparse == True:
+            self._inner = _SparseRange(span=range(combinations), goal=goal)
+        else:
+            self._inner = CoverRange(
+                name,
+                span=range(combinations),
+                goal=goal,
+                bypass=bypass,
+                max_steps=None,
+                cover=None,
+                advance=None,
+                details=Retention.NONE,
+            )
+            # remove that entry and use this instance
+            self._inner._untrack()
 
         net: CoverageNet
 
@@ -1018,9 +2318,7 @@ class CoverCross(CoverageNet):
             source += [net.get_source()]
             pass
 
-        # remove that entry and use this instance
-        self._group.pop()
-        # overwrite the entry with this instance in the class-wide data structure
+        # register this instance in the active session's nets
         super().__init__(name=name, bypass=bypass, source=source, sink=sink, target=None)
         pass
     
@@ -1053,19 +2351,17 @@ class CoverCross(CoverageNet):
 
     def advance(self, rand=False):
         index = self._inner.advance(rand)
+        if index == None:
+            return None
         # convert the 1-dimensional value into its n-dimensional value
-        item = self._pack(index)
-        # print(index, '->', item)
-
-        i = self._flatten(item)
-        # print(item, '->', i)
-
-        # expand to the entire parition space for each element
+        coords = self._pack(index)
+        # expand each partition into the source value(s) of its net
+        item = []
         for i, net in enumerate(self._nets):
-            item[i] *= net.get_range().step
-
-        # print(index, '->', item)
-        # exit('implement!')
+            values = net._get_bin_value(coords[i], rand)
+            if values == None:
+                return None
+            item += values if type(values) == list else [values]
         return item
 
 
@@ -1078,7 +2374,7 @@ class CoverCross(CoverageNet):
     
 
     def is_in_sample_space(self, item) -> bool:
-        for i, x in enumerate(item[::-1]):
+        for i, x in enumerate(item):
             if self._nets[i].is_in_sample_space(x) == False:
                 return False
         return True
@@ -1097,35 +2393,9 @@ class CoverCross(CoverageNet):
         '''
         # initialize the set of values to store in the item
         item = [0] * self.get_cross_count()
-
-        subgroup_sizes = [1] * self.get_cross_count()
-
-        for i in range(self.get_cross_count()):
-            subgroup_sizes[i] = self._nets[i].get_partition_count()
-            for j in range(i+1, self.get_cross_count()):
-                subgroup_sizes[i] *= self._nets[i].get_partition_count()
-            pass
-
-        subgroup_sizes = subgroup_sizes[::-1]
-        # print(subgroup_sizes)
-        # perform counting sequence and perform propery overflow/handling of the carry
-        for i in range(0, index):
-            item[0] += 1
-            carry = True
-            if item[0] >= subgroup_sizes[0]:
-                item[0] = 0
-            else:
-                carry = False
-            j = 1
-            while carry == True and j < self.get_cross_count():
-                item[j] += 1
-                if item[j] >= subgroup_sizes[j]:
-                    item[j] = 0
-                else:
-                    carry = False
-                j += 1
-                pass
-
+        # peel off the partition for each net starting from the largest stride
+        for i in range(self.get_cross_count()-1, -1, -1):
+            item[i], index = divmod(index, self._strides[i])
         return item
     
 
@@ -1139,17 +2409,14 @@ class CoverCross(CoverageNet):
         if len(item) != self.get_cross_count():
             raise Exception("Expects "+str(self._crosses)+" values in pair")
         index = 0
-        # dimensions go: x, y, z... so reverse the tuple/list
-        for i, x in enumerate(item[::-1]):
+        # dimensions go: x, y, z... where x has a stride of 1
+        for i, x in enumerate(item):
+            y = self._nets[i]._map_onto_range(x)
             # exit if an element was not a possible value
-            if self._nets[i].is_in_sample_space(x) == False:
+            if y == None:
                 return None
-            y = self._nets[i]._map_onto_range(x)
-            # collect all above partition sizes
-            acc_step_counts = 1
-            for j in range(i+1, self.get_cross_count()):
-                acc_step_counts *= self._nets[j].get_partition_count()
-            index += acc_step_counts * int(y / self._nets[i].get_range().step)
+            span = self._spans[i]
+            index += self._strides[i] * ((y - span.start) // span.step)
         return index
 
 
@@ -1168,7 +2435,71 @@ class CoverCross(CoverageNet):
         if self.is_in_sample_space(item) == False:
             return None
         index = self._flatten(item)
-        return self._inner.cover(index)
+        is_progress = self._inner.cover(index)
+        # the inner range is untracked, so record when its last bin was met
+        if is_progress == True and self._inner.passed() == True:
+            self._meet_net()
+        return is_progress
+
+
+    def would_progress(self, item) -> bool:
+        if self.is_in_sample_space(item) == False:
+            return False
+        return self._inner.would_progress(self._flatten(item))
+
+
+    def cover_many(self, values) -> int:
+        '''
+        Covers every item in `values` by flattening each item and then binning the
+        flattened indices at once.
+
+        Returns the number of items that got the cross closer to its goal.
+        '''
+        indices = [self._flatten(item) for item in values if self.is_in_sample_space(item) == True]
+        return self._load_hits(_histogram(indices))
+    
+
+    def _get_goal(self) -> int:
+        return self._inner._goal
+    
+
+    def _get_deficit(self) -> int:
+        return self._inner._deficit
+    
+
+    def _get_unmet_bins(self):
+        # a sparse cross does not list its unmet cells
+        if isinstance(self._inner, _SparseRange) == True:
+            return []
+        return self._inner._get_unmet_bins()
+    
+
+    def _meet_shared(self, index: int):
+        self._inner._meet_shared(index)
+        if self._inner.passed() == True:
+            self._meet_net()
+        pass
+    
+
+    def _get_hits(self):
+        return self._inner._get_hits()
+    
+
+    def _get_count(self, index: int) -> int:
+        return self._inner._get_count(index)
+    
+
+    def _set_count(self, index: int, count: int):
+        self._inner._set_count(index, count)
+        pass
+    
+
+    def _load_hits(self, hits) -> int:
+        progress = self._inner._load_hits(hits)
+        # the inner range is untracked, so record when its last bin was met
+        if progress > 0 and self._inner.passed() == True:
+            self._meet_net()
+        return progress
 
 
     def passed(self):
@@ -1205,4 +2536,286 @@ class __Test(_ut.TestCase):
         self.assertEqual(1 + 2*2 + 3*6, cross._flatten((1, 2, 3)))
         pass
 
+    def test_unmet_tally(self):
+        unmet = config.get_session()._unmet_nets
+        cr = CoverRange('r', span=range(0, 4), goal=2)
+        cp = CoverPoint('p', goal=1)
+        self.assertEqual(unmet + 2, config.get_session()._unmet_nets)
+        for x in [0, 1, 2, 3, 0, 1, 2]:
+            cr.cover(x)
+        self.assertEqual(3, cr.get_points_met())
+        self.assertEqual(False, cr.passed())
+        cr.cover(3)
+        self.assertEqual(True, cr.passed())
+        cp.cover(True)
+        self.assertEqual(unmet, config.get_session()._unmet_nets)
+        # covering beyond the goal does not change the tally
+        cr.cover(3)
+        cp.cover(True)
+        self.assertEqual(unmet, config.get_session()._unmet_nets)
+        pass
+
+    def test_advance_unmet_bins(self):
+        cr = CoverRange('wide', span=range(0, 2**32), max_steps=16)
+        step = cr.get_range().step
+        for _ in range(15):
+            cr.cover(cr.advance(rand=True))
+        # only one bin remains, so each advance must land inside it
+        last = cr._unmet_bins.first()
+        for _ in range(8):
+            self.assertEqual(last, cr.advance(rand=True) // step)
+        self.assertEqual(last * step, cr.advance(rand=False))
+        cr.cover(cr.advance(rand=True))
+        self.assertEqual(None, cr.advance(rand=True))
+
+        cg = CoverGroup('group', bins=[1, 2, 3, 4])
+        cg.cover(1)
+        cg.cover(3)
+        self.assertEqual(2, cg.advance(rand=False))
+        self.assertIn(cg.advance(rand=True), [2, 4])
+        pass
+
+    def test_cross_pack_3d(self):
+        cross = CoverCross('test', [CoverRange('a', span=range(0, 2)), CoverRange('b', span=range(0, 3)), CoverRange('c', span=range(0, 4))])
+        for i in range(2*3*4):
+            self.assertEqual(i, cross._flatten(cross._pack(i)))
+        self.assertEqual([1, 2, 3], cross._pack(1 + 2*2 + 3*6))
+        self.assertEqual([0, 1, 0], cross._pack(2))
+        pass
+
+    def test_cross_sparse(self):
+        nets = [CoverRange(str(i), span=range(0, 2**12), max_steps=None) for i in range(3)]
+        cross = CoverCross('sparse', nets, sparse=True)
+        self.assertEqual(2**36, cross.get_partition_count())
+        self.assertEqual([0, 0, 0], cross.advance(rand=False))
+        cross.cover((0, 0, 0))
+        self.assertEqual([1, 0, 0], cross.advance(rand=False))
+        item = cross.advance(rand=True)
+        self.assertEqual(True, cross.cover(item))
+        self.assertEqual(False, cross.cover(item))
+        self.assertEqual(2, cross.get_points_met())
+        self.assertEqual('2/' + str(2**36), cross.to_string(False))
+
+        cross = CoverCross('sparse small', [CoverRange('a', span=range(0, 2)), CoverRange('b', span=range(0, 2))], sparse=True)
+        while cross.passed() == False:
+            cross.cover(cross.advance(rand=True))
+        self.assertEqual(None, cross.advance(rand=True))
+
+        # the product can exceed the size of a C integer
+        nets = [CoverRange(str(i), span=range(0, 2**16), max_steps=None) for i in range(4)]
+        cross = CoverCross('sparse huge', nets, sparse=True)
+        self.assertEqual(2**64, cross.get_partition_count())
+        self.assertEqual(False, cross.passed())
+        self.assertEqual(True, cross.cover(cross.advance(rand=True)))
+        pass
+
+    def test_details_retention(self):
+        cr = CoverRange('top-k', span=range(0, 64), max_steps=1, details='top-k', max_details=4)
+        for x in [1, 1, 1, 2, 2, 3, 4, 5, 6, 7, 1]:
+            cr.cover(x)
+        counts = cr._mapped_items.get(0)
+        self.assertEqual(4, len(counts))
+        self.assertEqual(4, counts[1])
+
+        cr = CoverRange('reservoir', span=range(0, 64), max_steps=1, details='reservoir', max_details=4)
+        for x in range(64):
+            cr.cover(x)
+        self.assertEqual(4, sum(cr._mapped_items.get(0).values()))
+
+        cr = CoverRange('none', span=range(0, 64), max_steps=1, details=Retention.NONE)
+        cr.cover(0)
+        self.assertEqual(False, 0 in cr._mapped_items)
+        self.assertEqual(1, cr.get_points_met())
+        pass
+
+    def test_unmet_tally_cross(self):
+        unmet = config.get_session()._unmet_nets
+        a = CoverRange('a', span=range(0, 2))
+        b = CoverRange('b', span=range(0, 2))
+        cross = CoverCross('a x b', [a, b])
+        self.assertEqual(unmet + 3, config.get_session()._unmet_nets)
+        for pair in [(0, 0), (1, 0), (0, 1), (1, 1)]:
+            a.cover(pair[0])
+            b.cover(pair[1])
+            cross.cover(pair)
+        self.assertEqual(True, cross.passed())
+        self.assertEqual(unmet, config.get_session()._unmet_nets)
+        pass
+
+    def test_cover_many(self):
+        values = [0, 3, 3, 7, 9, 12, 15, 15, 15, 20]
+        # every net type must agree with covering each value one at a time
+        pairs = [
+            (CoverPoint('p1', goal=3, cover=lambda x: x == 15), CoverPoint('p2', goal=3, cover=lambda x: x == 15)),
+            (CoverRange('r1', span=range(0, 16), goal=2, max_steps=4), CoverRange('r2', span=range(0, 16), goal=2, max_steps=4)),
+            (CoverGroup('g1', bins=[3, 9, 15], goal=2, cover=lambda x: int(x) % 16), CoverGroup('g2', bins=[3, 9, 15], goal=2, cover=lambda x: int(x) % 16)),
+        ]
+        for (a, b) in pairs:
+            self.assertEqual(sum([1 for x in values if b.cover(x) == True]), a.cover_many(values))
+            self.assertEqual(b.to_string(True), a.to_string(True))
+            self.assertEqual(b.passed(), a.passed())
+        cross = CoverCross('c', nets=[pairs[1][0], pairs[2][0]])
+        self.assertEqual(2, cross.cover_many([(0, 3), (0, 3), (4, 9), (4, 8)]))
+        self.assertEqual(2, cross.get_points_met())
+        pass
+
+    def test_coverage_db(self):
+        import os, tempfile
+        cr = CoverRange('db range', span=range(0, 8), goal=2, max_steps=4)
+        cr.cover_many([0, 1, 7])
+        with tempfile.TemporaryDirectory() as dir:
+            path = os.path.join(dir, 'coverage.json')
+            CoverageDB.from_nets().write(path)
+            db = CoverageDB.read(path).merge(CoverageDB.read(path))
+        entry = [e for e in db._nets if e['name'] == 'db range'][0]
+        self.assertEqual([[0, 4], [3, 2]], entry['hits'])
+        self.assertEqual(2, db.get_points_met(entry))
+        self.assertEqual(2, len(db.get_runs()))
+
+        db = CoverageDB([{'name': 'db load', 'type': 'CoverRange', 'goal': 1, 'bypass': False, 'bins': 2, 'hits': [[1, 3]]}])
+        cr = CoverRange('db load', span=range(0, 2), goal=1)
+        self.assertEqual(1, db.apply())
+        self.assertEqual([0, 3], cr._table_counts)
+        self.assertEqual(1, cr.get_points_met())
+
+        db = CoverageDB([{'name': 'db no goal', 'type': 'CoverRange', 'goal': 0, 'bypass': False, 'bins': 4, 'hits': [[0, 1], [2, 5]]}])
+        self.assertEqual(4, db.get_points_met(db._nets[0]))
+        self.assertEqual(4, db.get_points_met())
+        pass
+
+    def test_shared_coverage(self):
+        owner = SharedCoverage.create(2, capacity=2**12)
+        worker = SharedCoverage(owner.get_name(), 2, 0, capacity=2**12)
+        with config.Session() as session:
+            cr = CoverRange('shared range', span=range(0, 4), goal=2)
+            cr.cover(0)
+            worker.sync(force=True)
+            offset = [off for (net, _, off) in worker._layout if net is cr][0]
+            self.assertEqual(1, owner._counts[2 + offset])
+            # act as a second process with the same nets that covered the remaining counts
+            peer = owner._stride
+            owner._counts[peer] = owner._counts[0]
+            owner._counts[peer + 1] = 1
+            for (i, k) in enumerate([1, 2, 2, 2]):
+                owner._counts[peer + 2 + offset + i] = k
+            worker.sync(force=True)
+            self.assertEqual(True, cr.passed())
+            self.assertEqual(0, session._unmet_nets)
+            # bins met by the other shard no longer report progress
+            self.assertEqual(False, cr.would_progress(1))
+            self.assertEqual(0, cr._get_deficit())
+            # local counts reaching the goal afterward do not meet the net twice
+            cr.cover(0)
+            self.assertEqual(0, session._unmet_nets)
+            # nets created after a reset are laid out from the start of the shard
+            session.reset()
+            cp = CoverPoint('shared point', goal=1)
+            cp.cover(True)
+            worker.sync(force=True)
+            self.assertEqual([(cp, cp, 0)], worker._layout)
+            self.assertEqual(1, owner._counts[2])
+        worker.close()
+        owner.close()
+        owner.unlink()
+        pass
+
+    def test_session(self):
+        default = config.get_session()
+        with config.Session(seed=7) as session:
+            self.assertIs(session.get_config(), config.Config())
+            cp = CoverPoint('session point', goal=1)
+            self.assertEqual([cp], Coverage.get_nets())
+            self.assertEqual(False, Coverage.all_passed())
+            cp.cover(True)
+            self.assertEqual(True, Coverage.all_passed())
+            self.assertEqual(1, Coverage.count())
+            session.reset()
+            self.assertEqual(0, len(Coverage.get_nets()))
+            # nets created before the reset no longer count toward the tally
+            old = CoverPoint('old point', goal=1)
+            session.reset()
+            new = CoverPoint('new point', goal=1)
+            old.cover(True)
+            self.assertEqual(False, Coverage.all_passed())
+            new.cover(True)
+            self.assertEqual(True, Coverage.all_passed())
+        self.assertIs(default, config.get_session())
+        self.assertNotIn(cp, Coverage.get_nets())
+        pass
+
+    def test_would_progress(self):
+        cr = CoverRange('dry range', span=range(0, 4), goal=1)
+        cg = CoverGroup('dry group', bins=[1, 2])
+        cross = CoverCross('dry cross', nets=[cr, cg])
+        self.assertEqual(True, cr.would_progress(2))
+        self.assertEqual(True, cross.would_progress((2, 1)))
+        # the query does not change any counts
+        self.assertEqual([0, 0, 0, 0], cr._table_counts)
+        cr.cover(2)
+        cross.cover((2, 1))
+        self.assertEqual(False, cr.would_progress(2))
+        self.assertEqual(False, cr.would_progress(9))
+        self.assertEqual(True, cg.would_progress(1))
+        self.assertEqual(False, cross.would_progress((2, 1)))
+        pass
+
+    def test_range_wide_span(self):
+        cr = CoverRange('wide', span=range(0, 2**60), max_steps=16)
+        self.assertEqual(2**56, cr.get_range().step)
+        self.assertEqual(True, cr.would_progress(2**60-1))
+        self.assertEqual(True, cr.cover(2**60-1))
+        self.assertEqual(1, cr._table_counts[15])
+        pass
+
+    def test_range_uneven_span(self):
+        cr = CoverRange('uneven', span=range(0, 100), max_steps=64)
+        self.assertEqual(2, cr.get_range().step)
+        self.assertEqual(50, cr.get_partition_count())
+        cr.cover_many(range(0, 100))
+        self.assertEqual(True, cr.passed())
+        pass
+
+    def test_deficit(self):
+        cp = CoverPoint('deficit point', goal=3)
+        cg = CoverGroup('deficit group', bins=[0, 1, 2], goal=2)
+        cr = CoverRange('deficit range', span=range(0, 8), goal=2)
+        cross = CoverCross('deficit cross', nets=[cr, cg], sparse=True)
+        cp.cover(True)
+        cp.cover_many([True, True, True])
+        cg.cover(1)
+        cg.cover_many([1, 1, 2])
+        cr.cover(5)
+        cr._load_hits([(5, 4), (6, 1)])
+        cross.cover((5, 1))
+        cross.cover((5, 1))
+        cross.cover_many([(6, 2), (6, 2), (6, 2)])
+        # the tracked deficit matches a recount from the hits
+        for net in [cp, cg, cr, cross]:
+            goal = net._get_goal()
+            self.assertEqual((goal * net._get_bin_count()) - sum([min(k, goal) for (_, k) in net._get_hits()]), net._get_deficit())
+        self.assertEqual(0, cp._get_deficit())
+        self.assertEqual(3, cg._get_deficit())
+        self.assertEqual(24 - 2, cross._get_deficit())
+        pass
+
+    def test_inverse_advance(self):
+        from .model import Signal
+        # narrow sources are enumerated to find the preimage of each bin
+        x = Signal(4)
+        cg = CoverGroup('parity', bins=[0, 1], target=x, cover=lambda s: bin(int(s)).count('1') % 2)
+        x.set(cg.advance(rand=False))
+        cg.cover(x)
+        self.assertEqual(1, cg.get_points_met())
+        x.set(cg.advance(rand=True))
+        cg.cover(x)
+        self.assertEqual(True, cg.passed())
+        # wider sources replay the values that were seen covering each bin
+        y = Signal(32)
+        cr = CoverRange('msb', span=range(0, 4), goal=2, target=y, cover=lambda s: int(s) >> 30)
+        self.assertEqual(None, cr.advance())
+        y.set(0xC0000001)
+        cr.cover(y)
+        self.assertEqual(0xC0000001, cr.advance())
+        pass
+
     pass
\ No newline at end of file
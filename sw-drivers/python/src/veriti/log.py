@@ -189,6 +189,8 @@ class Record:
 
 
     def __eq__(self, rhs):
+        if isinstance(rhs, Record) == False:
+            return False
         return self._timestamp == rhs._timestamp and \
             self._level == rhs._level and \
             self._topic == rhs._topic and \
@@ -209,14 +211,35 @@ class Log:
         self._tests = 0
         self._passes = 0
         self._fails = 0
+        # remember the earliest failing record
+        self._first_fail = None
+        # map each topic to its list of [tests, passes, fails]
+        self._topics = dict()
         for event in self._outcomes:
             event._max_ts_str_len = max_ts_str_len
-            if event._level.is_fail() == True or event._level.is_pass() == True:
-                self._tests += 1
-            if event._level.is_fail() == True:
-                self._fails += 1
-            if event._level.is_pass() == True:
-                self._passes += 1
+            self._tally(event)
+        pass
+
+
+    def _tally(self, event: Record):
+        '''
+        Updates the stats with the outcome of a single `event`.
+        '''
+        if event._level.is_fail() == False and event._level.is_pass() == False:
+            return
+        if event._topic not in self._topics:
+            self._topics[event._topic] = [0, 0, 0]
+        totals = self._topics[event._topic]
+        self._tests += 1
+        totals[0] += 1
+        if event._level.is_fail() == True:
+            self._fails += 1
+            totals[2] += 1
+            if self._first_fail == None:
+                self._first_fail = event
+        if event._level.is_pass() == True:
+            self._passes += 1
+            totals[1] += 1
         pass
 
 
@@ -247,6 +270,20 @@ class Log:
         return log
 
 
+    @staticmethod
+    def scan(path: str):
+        '''
+        Parses the provided file one record at a time to collect the stats.
+
+        Unlike `load(...)`, the records are not stored, so the memory usage does
+        not grow with the size of the file.
+        '''
+        log = Log([])
+        for event in records(path):
+            log._tally(event)
+        return log
+
+
     def is_success(self) -> bool:
         '''
         Determines if the log is successful (has 0 failures).
@@ -278,6 +315,32 @@ class Log:
     def get_outcomes(self):
         return self._outcomes
     
+
+    def get_first_fail(self) -> Record:
+        '''
+        Returns the earliest record with a failing outcome, or `None` if no test failed.
+        '''
+        return self._first_fail
+    
+
+    def get_topic_counts(self) -> dict:
+        '''
+        Returns a mapping of each topic to its tuple of (tests, passes, fails).
+        '''
+        return dict([(topic, tuple(totals)) for topic, totals in self._topics.items()])
+    
+
+    def is_passing(self, threshold: float=1.0) -> bool:
+        '''
+        Determines if verification passed based on meeting or exceeding the threshold value.
+
+        ### Parameters
+        - `threshold` expects a floating point value [0, 1.0]
+        '''
+        if self._tests <= 0:
+            return True
+        return float(self._passes/self._tests) >= threshold
+    
     
     def get_score(self):
         return round((self._passes/self._tests) * 100.0, 2) if self._tests > 0 else None
@@ -285,32 +348,55 @@ class Log:
     pass
 
 
-def read(logfile: str, level: int) -> str:
-    # process the log file
-    lg = Log.load(logfile)
+def records(path: str):
+    '''
+    Iterates through the records of the log file at `path` without reading the
+    entire file into memory.
+    '''
+    with open(path, 'r') as f:
+        for line in f:
+            # skip empty lines
+            if len(line.strip()) == 0:
+                continue
+            yield Record.from_str(line)
+    pass
 
-    result: str = ''
-    for event in lg.get_outcomes():
-        event: Record
-        # print all bad outcomes
+
+def stream(logfile: str, level: int):
+    '''
+    Iterates through the records of the log file that are at or above the severity `level`.
+    '''
+    event: Record
+    for event in records(logfile):
         if event._level.value >= level:
-            result += str(event) + '\n'
-        pass
-    
-    return result
+            yield event
+    pass
+
+
+def read(logfile: str, level: int) -> str:
+    # collect all outcomes at or above the level
+    return ''.join([str(event) + '\n' for event in stream(logfile, level)])
 
 
-def check(threshold: float=1.0) -> bool:
+def summarize() -> Log:
+    '''
+    Parses the log file once to collect the counts, score, first failure, and
+    per-topic totals.
+    '''
+    return Log.scan(get_event_log_path())
+
+
+def check(threshold: float=1.0, lg: Log=None) -> bool:
     '''
     Determines if verification passed based on meeting or exceeding the threshold value.
 
     ### Parameters
     - `threshold` expects a floating point value [0, 1.0]
+    - `lg` is an already parsed log to reuse instead of parsing the log file
     '''
-    lg = Log.load(get_event_log_path())
-    if lg.get_test_count() <= 0:
-        return True
-    return float(lg.get_pass_count()/lg.get_test_count()) >= threshold
+    if lg == None:
+        lg = summarize()
+    return lg.is_passing(threshold)
 
 
 def get_event_log_path() -> str:
@@ -323,11 +409,14 @@ def get_event_log_path() -> str:
     return str(os.path.abspath(path))
 
 
-def report_score() -> str:
+def report_score(lg: Log=None) -> str:
     '''
     Formats the score as a `str`.
+
+    Provide an already parsed log `lg` to reuse instead of parsing the log file.
     '''
-    lg = Log.load(get_event_log_path())
+    if lg == None:
+        lg = summarize()
     return (str(lg.get_score()) + ' % ' if lg.get_score() != None else 'N/A ') + '(' + str(lg.get_pass_count()) + '/' + str(lg.get_test_count()) + ')'
 
 
@@ -408,4 +497,32 @@ class __Test(_ut.TestCase):
         self.assertEqual(log.is_success(), True)
         pass
 
+
+    def test_log_scanning(self):
+        path = './raw-data/outcomes.log'
+        log = Log.scan(path)
+        self.assertEqual(len(log.get_outcomes()), 0)
+        self.assertEqual(log.get_pass_count(), 204)
+        self.assertEqual(log.get_fail_count(), 0)
+        self.assertEqual(log.get_test_count(), 204)
+
+        self.assertEqual(sum(1 for _ in records(path)), len(Log.load(path).get_outcomes()))
+        self.assertEqual(read(path, Level.INFO.value).count('\n'), 204)
+        pass
+
+
+    def test_log_summary(self):
+        data = '''[10 ns          ] INFO     ASSERTION    "sum - received 0 matches expected 0"
+[20 ns          ] ERROR    ASSERTION    "sum - received 1 does not match expected 0"
+[20 ns          ] WARN     STABILITY    "not a test"
+[30 ns          ] ERROR    MONITOR      "done - never asserted after waiting 5 cycles"
+'''
+        log = Log.from_str(data)
+        self.assertEqual(log.get_test_count(), 3)
+        self.assertEqual(log.get_first_fail()._timestamp, Timestamp(20, Timeunit.NS))
+        self.assertEqual(log.get_topic_counts(), {'ASSERTION': (2, 1, 1), 'MONITOR': (1, 0, 1)})
+        self.assertEqual(log.is_passing(), False)
+        self.assertEqual(log.is_passing(threshold=0.3), True)
+        pass
+
     pass
\ No newline at end of file
@@ -4,7 +4,6 @@
 # Defines various class and functions when working with a functional software 
 # model for a hardware design.
 
-import random as _random
 from enum import Enum as _Enum
 from .lib import to_logic, from_logic, pow2m1, pow2
 from . import config
@@ -37,6 +36,9 @@ class Mode(_Enum):
 class Strategy(_Enum):
     NONE = 0,
     LINEAR = 1,
+    GREEDY = 2,
+    LOOKAHEAD = 3,
+    SEARCH = 4,
 
     @staticmethod
     def from_str(s: str):
@@ -45,11 +47,90 @@ class Strategy(_Enum):
             return Strategy.NONE
         elif s == 'linear':
             return Strategy.LINEAR
+        elif s == 'greedy':
+            return Strategy.GREEDY
+        elif s == 'lookahead':
+            return Strategy.LOOKAHEAD
+        elif s == 'search':
+            return Strategy.SEARCH
         else:
             raise Exception('Failed to convert str '+s+' to type Strategy')
     pass
 
 
+def _import_numpy():
+    '''
+    Returns the numpy module if it is installed, otherwise returns `None`.
+    '''
+    try:
+        import numpy
+        return numpy
+    except ImportError:
+        return None
+
+
+def _range_len(r: range) -> int:
+    '''
+    Computes the number of elements in the range `r` without being limited to
+    the size of a C integer like `len(...)`.
+    '''
+    if r.step > 0:
+        return max(0, (r.stop - r.start + r.step - 1) // r.step)
+    return max(0, (r.start - r.stop - r.step - 1) // -r.step)
+
+
+class _AliasTable:
+    '''
+    Precompiled alias table (Vose's method) to draw weighted indices in constant time.
+    '''
+
+    def __init__(self, weights):
+        n = len(weights)
+        total = sum(weights)
+        if n == 0 or total <= 0:
+            raise Exception('Distribution requires at least one positive weight')
+        # scale the weights so the average is 1
+        scaled = [(w * n) / total for w in weights]
+        self._prob = [1.0] * n
+        self._alias = [i for i in range(n)]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while len(small) > 0 and len(large) > 0:
+            s = small.pop()
+            l = large.pop()
+            self._prob[s] = scaled[s]
+            self._alias[s] = l
+            # give the remaining probability of the large index to another column
+            scaled[l] = (scaled[l] + scaled[s]) - 1.0
+            if scaled[l] < 1.0:
+                small.append(l)
+            else:
+                large.append(l)
+        # any leftovers (due to rounding) fill their entire column
+        self._n = n
+        pass
+
+
+    def draw(self) -> int:
+        '''
+        Returns a single weighted index.
+        '''
+        rng = config.get_rng()
+        i = rng.randrange(self._n)
+        return i if rng.random() < self._prob[i] else self._alias[i]
+    
+
+    def draw_many(self, k: int, np, rng):
+        '''
+        Returns an array of `k` weighted indices using numpy's generator `rng`.
+        '''
+        i = rng.integers(0, self._n, size=k)
+        coin = rng.random(size=k)
+        return np.where(coin < np.asarray(self._prob)[i], i, np.asarray(self._alias)[i])
+    
+    pass
+
+
 class Distribution:
 
     def __init__(self, space, weights=None, partition: bool=True):
@@ -59,9 +140,10 @@ class Distribution:
 
         If `partition` is set to true, it will divide up the total sample space `space`
         into evenly paritioned groups summing to the total number of provided weights.
+        
+        When `space` is a range, it is partitioned into sub-ranges without listing its
+        elements, so the memory used does not depend on the size of the range.
         '''
-        import math as _math
-
         self._sample_space = space
         self._weights = weights
         # determine if to group the items together in divisible bins w/ weights weights[i]
@@ -70,9 +152,19 @@ class Distribution:
         # re-group the items
         self._partitioned_space = self._sample_space
         # print(self._partition)
-        if self._partition == True and type(self._weights) != type(None):
+        if self._partition == True and type(self._weights) != type(None) and type(self._sample_space) == range:
+            count = _range_len(self._sample_space)
+            self._events_per_weight = -(-count // len(weights))
+            # slice the range into evenly sized sub-ranges
             self._partitioned_space = []
-            self._events_per_weight = int(_math.ceil(len(self._sample_space) / len(weights)))
+            for i in range(0, -(-count // self._events_per_weight)):
+                start = self._sample_space.start + (i * self._events_per_weight * self._sample_space.step)
+                size = min(self._events_per_weight, count - (i * self._events_per_weight))
+                self._partitioned_space += [range(start, start + (size * self._sample_space.step), self._sample_space.step)]
+            pass
+        elif self._partition == True and type(self._weights) != type(None):
+            self._partitioned_space = []
+            self._events_per_weight = -(-len(self._sample_space) // len(weights))
             # initialize the bins
             for i, element in enumerate(self._sample_space):
                 # group the items together based on a common index that divides them into groups
@@ -83,26 +175,81 @@ class Distribution:
                     pass
                 self._partitioned_space[i_macro] += [element]
                 pass
+        elif type(self._sample_space) == range and type(self._weights) == type(None):
+            # a uniform range is a single partition
+            self._partitioned_space = [self._sample_space]
+        self._compile()
+        pass
+
+
+    def _compile(self):
+        '''
+        Precompiles the weights into an alias table over the partitions.
+        '''
+        weights = self._weights if self._weights != None else [1] * len(self._partitioned_space)
+        if len(weights) != len(self._partitioned_space):
+            raise Exception('The number of weights ('+str(len(weights))+') does not match the number of partitions ('+str(len(self._partitioned_space))+')')
+        self._table = _AliasTable(weights)
+        # store each partition as (start, step, length) when it is a flat range of integers
+        self._flat = []
+        for event in self._partitioned_space:
+            if type(event) == int:
+                self._flat += [(event, 1, 1)]
+            elif type(event) == range and _range_len(event) > 0:
+                self._flat += [(event.start, event.step, _range_len(event))]
+            else:
+                self._flat = None
+                break
+            pass
         pass
 
 
+    @staticmethod
+    def _unfold(event):
+        '''
+        Unfolds inner lists and ranges until reaching a single value.
+        '''
+        while type(event) == list:
+            event = config.get_rng().choice(event)
+        # select from a range arithmetically
+        if type(event) == range:
+            event = event.start + (event.step * config.get_rng().randrange(_range_len(event)))
+        return event
+
+
+    def sample(self):
+        '''
+        Produce a single sample from the known distribution.
+        '''
+        return Distribution._unfold(self._partitioned_space[self._table.draw()])
+
+
     def samples(self, k=1):
         '''
-        Produce a sample from the known distribution.
+        Produce `k` samples from the known distribution.
+
+        When numpy is installed, the samples are drawn in one vectorized call. The
+        numpy generator is seeded from the session's random number generator to remain reproducible.
         '''
-        outcomes = _random.choices(population=self._partitioned_space, weights=self._weights, k=k)
-        results = []
-        for event in outcomes:
-            # unfold inner lists and ranges
-            while type(event) == range or type(event) == list:
-                event = _random.choice(event)
-            results += [event]
-        return results
+        np = _import_numpy()
+        if np == None or k <= 1:
+            return [self.sample() for _ in range(k)]
+        
+        rng = np.random.default_rng(config.get_rng().getrandbits(64))
+        indices = self._table.draw_many(k, np, rng)
+        # compute values directly when every partition is a range that fits in 64 bits
+        if self._flat != None and all([start >= 0 and start + (step * length) < 2**63 for (start, step, length) in self._flat]) == True:
+            flat = np.asarray(self._flat, dtype=np.int64)[indices]
+            return (flat[:, 0] + (flat[:, 1] * rng.integers(0, flat[:, 2]))).tolist()
+        return [Distribution._unfold(self._partitioned_space[i]) for i in indices.tolist()]
     pass
 
 
 class Signal:
 
+    # avoid a per-instance dictionary for models with many ports
+    __slots__ = ('_mode', '_inferred_mode', '_width', '_big_endian', '_value', '_name', '_dist')
+
     def __init__(self, width: int=None, mode: Mode=Mode.INFER, value=0, endianness: str='big', name: str=None, dist: Distribution=None):
         '''
         Create a new Signal instance.
@@ -150,7 +297,7 @@ class Signal:
         # provide explicit distribution of values for sampling
         self._dist = dist
         if type(self._dist) == list:
-            self._dist = Distribution(space=[*self.get_range()], weights=dist, partition=True)
+            self._dist = Distribution(space=self.get_range(), weights=dist, partition=True)
             pass
         pass
 
@@ -203,9 +350,9 @@ class Signal:
         '''
         # provide uniform distribution when no distribution is defined for the signal
         if self._dist == None:
-            self._value = _random.randint(self.min(), self.max())
+            self._value = config.get_rng().randint(self.min(), self.max())
         else:
-            self._value = self._dist.samples(k=1)[0]
+            self._value = self._dist.sample()
         # ensure the selected data is allowed and in bounds
         if self._value < self.min() or self._value > self.max():
             raise Exception("Value out of bounds")
@@ -220,11 +367,9 @@ class Signal:
         If `signed` is set to True, then it will return the 2's complement
         representation.
         '''
-        if signed == True:
-            # convert to bits
-            bits = to_logic(self._value, self._width, big_endian=True)
-            num = from_logic(bits, signed=True)
-            return num
+        if signed == True and (self._value >> (self._width-1)) & 1 == 1:
+            # subtract the weight of the MSB
+            return self._value - (1 << self._width)
         return self._value
     
 
@@ -292,31 +437,52 @@ class Signal:
         return self[index]
 
 
-    def __getitem__(self, key: int) -> str:
-        vec = self.to_logic()
-        # reverse to count from 0 to width-1
-        if self._big_endian == True:
-            vec = vec[::-1]
-        return vec[key]
+    def _bit_index(self, key: int) -> int:
+        '''
+        Resolves the `key` into the bit position of the integer value.
+        
+        Bit `i` is always the `i`th bit of the integer value regardless of
+        endianness, since endianness only determines the order of the 
+        logic values when written.
+        '''
+        index = key + self._width if key < 0 else key
+        if index < 0 or index >= self._width:
+            raise IndexError('Bit index '+str(key)+' out of range for width '+str(self._width))
+        return index
     
 
-    def __setitem__(self, key: int, value: str):
-        new_val: str = '1' if int(value) == 1 else '0'
-        vec = self.to_logic()
-        # reverse to count from 0 to width-1
-        if self._big_endian == True:
-            vec = vec[::-1]
-        result = ''
+    def slice(self, hi: int, lo: int):
+        '''
+        Returns a view of the bits from `hi` down to `lo` (inclusive) that reads
+        and writes this signal's value.
+        '''
+        return SignalSlice(self, hi, lo)
 
-        for i, bit in enumerate(vec):
-            if key == i:
-                result += new_val
-            else:
-                result += bit
-        # reverse back
-        if self._big_endian == True:
-            result = result[::-1]
-        self.set(result)
+
+    def __getitem__(self, key):
+        '''
+        Accesses the bit at index `key`, or a view of a range of bits when `key` is a slice.
+
+        Slices follow the VHDL `hi downto lo` convention: `s[hi:lo]` covers the bits
+        from `hi` down to `lo`, both inclusive, so `s[7:4]` is 4 bits wide. Both bounds
+        are required and a step is not allowed.
+        '''
+        if isinstance(key, slice) == True:
+            if key.start == None or key.stop == None or key.step != None:
+                raise IndexError('Slice of a signal must be written as [hi:lo]')
+            return self.slice(key.start, key.stop)
+        return '1' if (self._value >> self._bit_index(key)) & 1 == 1 else '0'
+    
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice) == True:
+            self[key].set(value)
+            return
+        index = self._bit_index(key)
+        if int(value) == 1:
+            self._value |= (1 << index)
+        else:
+            self._value &= ~(1 << index)
         pass
 
 
@@ -330,29 +496,571 @@ class Signal:
     pass
 
 
-def __compile_ports(model):
+class SignalSlice:
     '''
-    Compiles the list of ports into a mapping where the 'key' is the defined name
-    and the 'value' is a tuple (Signal, Dict).
+    A view of a contiguous range of bits within a Signal.
+
+    Reading and writing the slice operates directly on the parent signal's 
+    integer value.
     '''
-    # save computations
-    if hasattr(model, '__veriti_cached_ports') == True:
-        return model.__veriti_cached_ports
+
+    def __init__(self, parent: Signal, hi: int, lo: int):
+        if lo < 0 or hi >= parent.get_width() or hi < lo:
+            raise IndexError('Slice '+str(hi)+' downto '+str(lo)+' out of range for width '+str(parent.get_width()))
+        self._parent = parent
+        self._lo = lo
+        self._width = (hi - lo) + 1
+        self._mask = pow2m1(self._width)
+        pass
+
+
+    def get_width(self) -> int:
+        return self._width
     
-    model.__veriti_cached_ports = dict()
-    for (key, val) in vars(model).items():
-        # only python variables declared as signals can be a port
-        if isinstance(val, Signal) == False:
-            continue
-        # override variable name with explicit name provided
-        defined_name = key if val._name == None else val._name
-        # check if the name is in the port interface data
-        loc = config.Config().locate_port(defined_name)
-        if loc != -1:
-            # store the interface data and the signal data together
-            model.__veriti_cached_ports[defined_name] = (val, loc)
+
+    def max(self) -> int:
+        return self._mask
+    
+
+    def min(self) -> int:
+        return 0
+    
+
+    def to_int(self, signed: bool=False) -> int:
+        value = (self._parent._value >> self._lo) & self._mask
+        if signed == True and (value >> (self._width-1)) & 1 == 1:
+            return value - (1 << self._width)
+        return value
+    
+
+    def to_logic(self) -> str:
+        return to_logic(self.to_int(), self._width, big_endian=self._parent._big_endian)
+    
+
+    def set(self, num, is_signed=False):
+        '''
+        Writes `num` into the bits of the parent signal covered by this slice.
+        '''
+        if type(num) == str:
+            if len(num) > self._width:
+                raise Exception("Value out of bounds")
+            if self._parent._big_endian == False:
+                num = num[::-1]
+            num = from_logic(num, is_signed) & self._mask
+        elif type(num) == int:
+            if num < self.min() or num > self.max():
+                raise Exception("Value out of bounds")
+        else:
+            raise Exception("Cannot set signal with type "+str(type(num)))
+        self._parent._value = (self._parent._value & ~(self._mask << self._lo)) | (num << self._lo)
+        pass
+
+
+    def __getitem__(self, key: int) -> str:
+        index = key + self._width if key < 0 else key
+        if index < 0 or index >= self._width:
+            raise IndexError('Bit index '+str(key)+' out of range for width '+str(self._width))
+        return self._parent[self._lo + index]
+    
+
+    def __setitem__(self, key: int, value):
+        index = key + self._width if key < 0 else key
+        if index < 0 or index >= self._width:
+            raise IndexError('Bit index '+str(key)+' out of range for width '+str(self._width))
+        self._parent[self._lo + index] = value
+        pass
+
+
+    def __str__(self):
+        return self.to_logic()
+    
+
+    def __int__(self):
+        return self.to_int()
+    
+    pass
+
+
+class _BankSignal(Signal):
+    '''
+    A lightweight handle to a single signal whose value is stored in a SignalBank.
+    '''
+
+    __slots__ = ('_bank', '_index')
+
+    def __init__(self, bank, index: int, name: str, mode: Mode, big_endian: bool, dist: Distribution):
+        self._bank = bank
+        self._index = index
+        self._mode = mode
+        self._inferred_mode = None
+        self._width = bank.get_width()
+        self._big_endian = big_endian
+        self._name = name
+        self._dist = dist
+        pass
+
+
+    @property
+    def _value(self) -> int:
+        return self._bank._values[self._index]
+    
+
+    @_value.setter
+    def _value(self, value: int):
+        self._bank._values[self._index] = value
+
+    pass
+
+
+class SignalBank:
+    '''
+    A collection of same-width signals whose values are stored together in one
+    contiguous integer array.
+
+    Each signal is exposed as a named handle that behaves like a `Signal` and is 
+    found as a port by its name in the interface data.
+    '''
+    from typing import List as _List
+
+    def __init__(self, names: _List[str], width: int=None, mode: Mode=Mode.INFER, endianness: str='big', dist: Distribution=None):
+        '''
+        Create a new SignalBank instance.
+
+        ### Parameters
+        - The `names` parameter is the list of port names, one for each signal in the bank.
+        - The `width`, `mode`, `endianness`, and `dist` parameters are shared by every signal in the 
+        bank and behave the same as they do for a `Signal`.
+        '''
+        import array as _array
+
+        self._width = width if width != None else 1
+        if self._width <= 0:
+            raise Exception('Signal cannot have width less than or equal to 0')
+        if endianness != 'big' and endianness != 'little':
+            raise Exception("Signal must either have 'big' or 'little' endianness")
+        mode = mode if isinstance(mode, str) == False else Mode.from_str(mode)
+
+        # store the values in a machine-sized array when they fit
+        if self._width <= 64:
+            self._values = _array.array('Q', [0] * len(names))
+        else:
+            self._values = [0] * len(names)
+
+        self._dist = dist
+        if type(self._dist) == list:
+            self._dist = Distribution(space=range(0, pow2(self._width)), weights=dist, partition=True)
+
+        self._lookup = dict()
+        handles = []
+        for i, name in enumerate(names):
+            self._lookup[name] = i
+            handles += [_BankSignal(self, i, name, mode, endianness == 'big', self._dist)]
+        self._handles = tuple(handles)
+        pass
+
+
+    def get_width(self) -> int:
+        '''
+        Accesses the number of bits set for each signal.
+        '''
+        return self._width
+    
+
+    def get_names(self):
+        '''
+        Returns the list of names for each signal in the bank.
+        '''
+        return [sig._name for sig in self._handles]
+    
+
+    def __len__(self) -> int:
+        return len(self._handles)
+    
+
+    def __iter__(self):
+        return iter(self._handles)
+    
+
+    def __getitem__(self, key) -> Signal:
+        '''
+        Accesses the handle to a signal by its index or its name.
+        '''
+        if type(key) == str:
+            return self._handles[self._lookup[key]]
+        return self._handles[key]
+    
+
+    def randomize(self):
+        '''
+        Sets every signal in the bank to a random value based on its distribution.
+        '''
+        if self._dist == None:
+            hi = pow2m1(self._width)
+            rng = config.get_rng()
+            for i in range(len(self._values)):
+                self._values[i] = rng.randint(0, hi)
+        else:
+            for i, value in enumerate(self._dist.samples(k=len(self._values))):
+                self._values[i] = value
+        return self
+    
+
+    def to_ints(self):
+        '''
+        Returns the list of integer values for every signal in the bank.
+        '''
+        return list(self._values)
+
+
+    def to_logic(self, delim: str=',') -> str:
+        '''
+        Casts every signal into its series of 1's and 0's, each followed by `delim`.
+        '''
+        big_endian = self._handles[0]._big_endian if len(self._handles) > 0 else True
+        return ''.join([to_logic(value, self._width, big_endian=big_endian) + delim for value in self._values])
+    
+    pass
+
+
+class _VectorSignal(Signal):
+    '''
+    A lightweight handle that reads and writes the value at the current row of a SignalVector.
+    '''
+
+    __slots__ = ('_vector',)
+
+    def __init__(self, vector):
+        self._vector = vector
+        self._mode = vector._mode
+        self._inferred_mode = None
+        self._width = vector.get_width()
+        self._big_endian = vector._big_endian
+        self._name = vector._name
+        self._dist = vector._dist
+        pass
+
+
+    @property
+    def _value(self) -> int:
+        return self._vector._values[self._vector._cursor]
+    
+
+    @_value.setter
+    def _value(self, value: int):
+        self._vector._values[self._vector._cursor] = value
+
+    pass
+
+
+class SignalVector:
+    '''
+    A port that holds the values of many transactions at once, stored together in 
+    one contiguous integer array.
+
+    A model built from SignalVectors evaluates an entire batch of transactions per
+    call, using `to_numpy()` to apply vectorized arithmetic when numpy is installed.
+    '''
+
+    def __init__(self, width: int=None, mode: Mode=Mode.INFER, size: int=0, endianness: str='big', name: str=None, dist: Distribution=None):
+        '''
+        Create a new SignalVector instance.
+
+        ### Parameters
+        - The `size` parameter is the initial number of transactions held, each set to 0.
+        - The `width`, `mode`, `endianness`, `name`, and `dist` parameters apply to the value of every transaction 
+        and behave the same as they do for a `Signal`.
+        '''
+        self._mode = mode if isinstance(mode, str) == False else Mode.from_str(mode)
+        self._inferred_mode = None
+
+        self._width = width if width != None else 1
+        if self._width <= 0:
+            raise Exception('Signal cannot have width less than or equal to 0')
+        if endianness != 'big' and endianness != 'little':
+            raise Exception("Signal must either have 'big' or 'little' endianness")
+        self._big_endian = str(endianness).lower() == 'big'
+
+        self._name = name
+
+        self._dist = dist
+        if type(self._dist) == list:
+            self._dist = Distribution(space=range(0, pow2(self._width)), weights=dist, partition=True)
+
+        self._store([0] * size)
+        # the row read and written through the handle returned by `row(...)`
+        self._cursor = 0
+        self._row = _VectorSignal(self)
+        pass
+
+
+    def _store(self, values):
+        '''
+        Replaces the stored values without checking their bounds.
+        '''
+        import array as _array
+
+        np = _import_numpy()
+        # store the values in a machine-sized array when they fit
+        if self._width > 64:
+            self._values = [int(v) for v in values]
+        elif np != None and isinstance(values, np.ndarray) == True:
+            self._values = _array.array('Q', values.astype(np.uint64).tobytes())
+        else:
+            self._values = _array.array('Q', values)
         pass
-    return model.__veriti_cached_ports
+
+
+    def get_width(self) -> int:
+        '''
+        Accesses the number of bits set for each transaction's value.
+        '''
+        return self._width
+    
+
+    def get_mode(self) -> Mode:
+        '''
+        Returns the type of port the signal is.
+        '''
+        return self._mode if self._inferred_mode == None else self._inferred_mode
+    
+
+    def get_range(self) -> range:
+        '''
+        Returns the range of possible values for the specified bit width.
+        
+        The start is inclusive and the end is exclusive.
+        '''
+        return range(self.min(), pow2(self.get_width()))
+
+
+    def max(self) -> int:
+        '''
+        Returns the maximum possible integer value stored in the allotted bits
+        (inclusive).
+        '''
+        return pow2m1(self.get_width())
+    
+
+    def min(self) -> int:
+        '''
+        Returns the minimum possible integer value stored in the allotted bits 
+        (inclusive).
+        '''
+        return 0
+    
+
+    def randomize(self, n: int=None):
+        '''
+        Sets the data to `n` random values based on its distribution. If `n` is 
+        omitted, the current number of transactions is kept.
+
+        If no distribution was defined for the SignalVector, it wil use a uniform
+        distribution across the minimum and maximum values, inclusively.
+        '''
+        n = len(self) if n == None else n
+        np = _import_numpy()
+        if self._dist != None:
+            self._store(self._dist.samples(k=n))
+        elif np != None and self._width <= 64:
+            # seed the numpy generator from the session's random number generator to remain reproducible
+            rng = np.random.default_rng(config.get_rng().getrandbits(64))
+            self._store(rng.integers(0, self.max(), size=n, dtype=np.uint64, endpoint=True))
+        else:
+            rng = config.get_rng()
+            self._store([rng.randint(self.min(), self.max()) for _ in range(n)])
+        return self
+    
+
+    def set(self, values):
+        '''
+        Sets the data to the sequence of integer `values`, one per transaction. The 
+        `values` may also be a numpy array.
+        '''
+        if len(values) > 0:
+            # numpy arrays compute their bounds without iterating in python
+            (lo, hi) = (values.min(), values.max()) if hasattr(values, 'min') == True else (min(values), max(values))
+            if lo < self.min() or hi > self.max():
+                raise Exception("Value out of bounds")
+        self._store(values)
+        return self
+    
+
+    def row(self, index: int) -> Signal:
+        '''
+        Returns a handle that behaves like a `Signal` for the transaction at `index`.
+
+        The same handle is shared across calls, so it always refers to the row
+        most recently selected.
+        '''
+        if index < 0 or index >= len(self._values):
+            raise IndexError('Row '+str(index)+' out of range for '+str(len(self._values))+' transactions')
+        self._cursor = index
+        return self._row
+    
+
+    def to_ints(self):
+        '''
+        Returns the list of integer values for every transaction.
+        '''
+        return list(self._values)
+    
+
+    def to_numpy(self):
+        '''
+        Returns a numpy array of every transaction's value. 
+        
+        The array shares its memory with this vector when the width is at most 
+        64 bits, so writes to the array are seen by the vector.
+        '''
+        np = _import_numpy()
+        if np == None:
+            raise Exception('SignalVector.to_numpy() requires numpy to be installed')
+        if self._width > 64:
+            return np.array(self._values, dtype=object)
+        return np.frombuffer(self._values, dtype=np.uint64)
+    
+
+    def to_logic(self):
+        '''
+        Casts every transaction's value into a series of 1's and 0's in a string.
+        
+        If the signal is 'big-endian', then the MSB is first in the sequence. 
+        Otherwise, the LSB is first in the sequence.
+        '''
+        spec = '0' + str(self._width) + 'b'
+        if self._big_endian == True:
+            return [format(v, spec) for v in self._values]
+        return [format(v, spec)[::-1] for v in self._values]
+    
+
+    def __len__(self) -> int:
+        return len(self._values)
+    
+
+    def __iter__(self):
+        return iter(self._values)
+    
+
+    def __getitem__(self, index: int) -> int:
+        return self._values[index]
+    
+
+    def __setitem__(self, index: int, value: int):
+        if value < self.min() or value > self.max():
+            raise Exception("Value out of bounds")
+        self._values[index] = value
+        pass
+
+    pass
+
+
+_CACHED_PORTS_ATTR = '__veriti_cached_ports'
+
+
+class _PortPlan:
+    '''
+    The compiled ports of a model ordered by their position in the interface data.
+
+    A plan remains valid until the interface data is updated, the model's
+    attributes are added or removed, or one of its signal attributes or
+    attributes named after a port is reassigned.
+    '''
+
+    def __init__(self, model):
+        attrs = vars(model)
+        self._version = config.Config()._ports_version
+        # count the cached plan itself as an attribute of the model
+        self._num_attrs = len(attrs) + (0 if _CACHED_PORTS_ATTR in attrs else 1)
+        # map every signal attribute and every attribute named after a port to its
+        # object to detect reassignments
+        watched = dict()
+        for key in config.Config()._port_index:
+            watched[key] = attrs.get(key)
+        # store tuples of (index, name, signal) for each port
+        ports = []
+        for (key, val) in attrs.items():
+            # only python variables declared as signals (or banks/vectors of signals) can be a port
+            if isinstance(val, Signal) == True or isinstance(val, SignalVector) == True:
+                candidates = [val]
+            elif isinstance(val, SignalBank) == True:
+                candidates = val
+            else:
+                continue
+            watched[key] = val
+            for sig in candidates:
+                # override variable name with explicit name provided
+                defined_name = key if sig._name == None else sig._name
+                # check if the name is in the port interface data
+                loc = config.Config().locate_port(defined_name)
+                if loc != -1:
+                    # resolve the mode from the interface data once
+                    sig._inferred_mode = Mode.from_str(config.Config().get_port(loc)['mode']) if sig._mode == Mode.INFER else sig._mode
+                    ports += [(loc, defined_name, sig)]
+                pass
+            pass
+        self._watched = tuple(watched.items())
+        ports.sort(key=lambda x: x[0])
+        # map each mode to its frozen tuple of (name, signal) and tuple of signals
+        self._plans = dict()
+        for mode in Mode:
+            pairs = tuple([(name, sig) for (_, name, sig) in ports if sig.get_mode() == mode])
+            self._plans[mode] = (pairs, tuple([sig for (_, sig) in pairs]))
+        pass
+
+
+    def is_valid(self, model) -> bool:
+        '''
+        Checks if the plan still reflects the interface data and the `model`'s attributes.
+        '''
+        if self._version != config.Config()._ports_version:
+            return False
+        attrs = vars(model)
+        if len(attrs) != self._num_attrs:
+            return False
+        for (key, val) in self._watched:
+            if attrs.get(key) is not val:
+                return False
+        return True
+    
+
+    def get_pairs(self, mode: Mode):
+        '''
+        Returns the ordered tuple of (name, signal) for the ports with the given `mode`.
+        '''
+        return self._plans[mode][0]
+    
+
+    def get_signals(self, mode: Mode):
+        '''
+        Returns the ordered tuple of signals for the ports with the given `mode`.
+        '''
+        return self._plans[mode][1]
+
+    pass
+
+
+def __compile_ports(model) -> _PortPlan:
+    '''
+    Compiles the ports of the `model` into a plan that orders the ports for each mode.
+
+    The plan is cached in the model and only recompiled when it is no longer valid.
+    '''
+    # save computations
+    plan: _PortPlan = vars(model).get(_CACHED_PORTS_ATTR)
+    if plan != None and plan.is_valid(model) == True:
+        return plan
+    
+    plan = _PortPlan(model)
+    setattr(model, _CACHED_PORTS_ATTR, plan)
+    return plan
+
+
+def get_port_plan(model, mode: Mode):
+    '''
+    Collects the signals defined in the `model` as ports for the given `mode` into
+    a tuple ordered by the interface data.
+    '''
+    return __compile_ports(model).get_signals(mode)
     
 
 def get_ports(model, mode: Mode):
@@ -360,33 +1068,294 @@ def get_ports(model, mode: Mode):
     Collects the attributes defined in the `model` into a list storing
     the tuples of their (name, signal).
     '''
-    results = []
+    return list(__compile_ports(model).get_pairs(mode))
+
 
-    key: str
-    sig: Signal
-    index: int
-    for (key, (sig, index)) in __compile_ports(model).items():
-        use_mode = Mode.from_str(config.Config().get_port(index)['mode']) if sig._mode == Mode.INFER else sig._mode
-        sig._inferred_mode = use_mode
-        if use_mode != mode:
+def _advance_greedy(ports):
+    '''
+    Advances every failing net whose sources are within the `ports`, skipping nets
+    that write to ports already claimed by a net further from its goal.
+    '''
+    from .coverage import CoverageNet, Coverage
+
+    net: CoverageNet
+
+    candidates = []
+    for net in Coverage.get_failing_nets():
+        if net.has_source() == True:
+            # verify each writer exists in this current model
+            for source in net.get_source_list():
+                if source not in ports:
+                    break
+            else:
+                candidates += [net]
+        pass
+    # prioritize the nets that are furthest from their goal
+    candidates.sort(key=lambda n: n._get_deficit(), reverse=True)
+    claimed = set()
+    for net in candidates:
+        sources = net.get_source_list()
+        if any([id(source) in claimed for source in sources]) == True:
+            continue
+        values = net.advance(rand=True)
+        if values == None:
+            continue
+        # force into an iterable type
+        if type(values) == int:
+            values = [values]
+        for i in range(len(sources)):
+            sources[i].set(values[i])
+            claimed.add(id(sources[i]))
+        pass
+    pass
+
+
+def _snapshot(model) -> list:
+    '''
+    Captures the state of the `model` as a list of tuples storing (object, contents) 
+    for every signal, container (list, dict, set, bytearray), and object with a 
+    `__dict__` reachable from its attributes.
+
+    Only the contents are copied, so `_restore(...)` puts the state back into the same
+    objects. Modules, classes, functions, and coverage nets are not captured.
+    '''
+    import copy, types
+    from .coverage import CoverageNet
+
+    state = []
+    seen = set()
+    stack = [model]
+    while len(stack) > 0:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, Signal) == True:
+            state += [(obj, obj._value)]
             continue
-        results += [(index, key, sig)]
+        if isinstance(obj, SignalBank) == True or isinstance(obj, SignalVector) == True:
+            state += [(obj, copy.copy(obj._values))]
+            continue
+        if isinstance(obj, list) == True:
+            saved = list(obj)
+            children = saved
+        elif isinstance(obj, dict) == True:
+            saved = dict(obj)
+            children = list(saved.values())
+        elif isinstance(obj, set) == True:
+            saved = set(obj)
+            children = list(saved)
+        elif isinstance(obj, bytearray) == True:
+            saved = bytes(obj)
+            children = []
+        # tuples cannot change, but they may hold objects that can
+        elif isinstance(obj, tuple) == True:
+            stack += list(obj)
+            continue
+        elif hasattr(obj, '__dict__') == True and isinstance(obj, (type, types.ModuleType, types.FunctionType, types.MethodType, CoverageNet)) == False:
+            saved = dict(vars(obj))
+            children = list(saved.values())
+        else:
+            continue
+        state += [(obj, saved)]
+        stack += children
+    return state
+
+
+def _restore(model, state: list):
+    '''
+    Returns the `model` to the `state` captured by `_snapshot(...)` without replacing
+    any of its objects.
+    '''
+    import copy
+    for (obj, saved) in state:
+        if isinstance(obj, Signal) == True:
+            obj._value = saved
+        elif isinstance(obj, SignalBank) == True or isinstance(obj, SignalVector) == True:
+            obj._values = copy.copy(saved)
+        elif isinstance(obj, list) == True or isinstance(obj, bytearray) == True:
+            obj[:] = saved
+        elif isinstance(obj, dict) == True or isinstance(obj, set) == True:
+            obj.clear()
+            obj.update(saved)
+        else:
+            attrs = vars(obj)
+            attrs.clear()
+            attrs.update(saved)
+        pass
+    pass
+
+
+def _save_port(port):
+    '''
+    Returns a copy of the value(s) held by the `port`.
+    '''
+    import copy
+    if isinstance(port, Signal) == True:
+        return port._value
+    return copy.copy(port._values)
+
+
+def _load_port(port, saved):
+    '''
+    Writes the value(s) returned by `_save_port(...)` back into the `port`.
+    '''
+    import copy
+    if isinstance(port, Signal) == True:
+        port._value = saved
+    else:
+        port._values = copy.copy(saved)
+    pass
+
+
+def _advance_lookahead(model, ports, candidates: int):
+    '''
+    Draws a number of `candidates` input vectors, evaluates the `model` on each from 
+    the same starting state, and keeps the inputs that would make progress on the 
+    most failing nets.
+    '''
+    from .coverage import CoverageNet, Coverage
+
+    net: CoverageNet
+    port: Signal
+
+    if hasattr(model, 'evaluate') == False:
+        raise Exception("Strategy 'lookahead' requires the model to define an 'evaluate()' method")
+    
+    nets = [net for net in Coverage.get_failing_nets() if net.has_sink() == True]
+    state = _snapshot(model)
+    best = None
+    best_score = -1
+    for j in range(candidates):
+        if j > 0:
+            _restore(model, state)
+            for port in ports:
+                port.randomize()
+        # direct the first candidate toward the failing nets that can be written
+        else:
+            _advance_greedy(ports)
+        values = [_save_port(port) for port in ports]
+        model.evaluate()
+        # score the candidate without changing any coverage counts
+        score = sum([1 for net in nets if net.would_progress(net.get_sink()) == True])
+        if score > best_score:
+            best = values
+            best_score = score
         pass
+    # leave the model in its starting state with the best inputs applied
+    _restore(model, state)
+    for (port, value) in zip(ports, best):
+        _load_port(port, value)
+    pass
+
+
+# number of search steps between restarts from previously successful inputs
+_SEARCH_RESTART = 4
+# maximum number of successful inputs cached per net
+_SEARCH_CACHE = 16
 
-    results.sort()
-    # store tuple with (name, signal)
-    results = [(x[1], x[2]) for x in results]
-    return results
 
+def _neighbor(values: list, ports) -> list:
+    '''
+    Returns a copy of the input `values` with one port changed, either by flipping
+    one of its bits or by drawing it again from its distribution.
+    '''
+    rng = config.get_rng()
+    values = list(values)
+    i = rng.randrange(len(ports))
+    if rng.random() < 0.5:
+        values[i] ^= 1 << rng.randrange(ports[i].get_width())
+    else:
+        ports[i].randomize()
+        values[i] = ports[i]._value
+    return values
+
+
+def _advance_search(model, ports, candidates: int):
+    '''
+    Searches the input space for values that make the failing output-side net
+    furthest from its goal progress, evaluating the `model` up to `candidates` times.
 
-def randomize(model, strategy: str='none'):
+    The search hill-climbs from the current inputs by changing one port at a time and 
+    restarts from the inputs that previously made the net progress. Inputs found to 
+    make progress are cached in the session for the net.
+    '''
+    from .coverage import CoverageNet, Coverage
+
+    net: CoverageNet
+    port: Signal
+
+    if hasattr(model, 'evaluate') == False:
+        raise Exception("Strategy 'search' requires the model to define an 'evaluate()' method")
+    
+    # nets with sources are still advanced directly
+    _advance_greedy(ports)
+    nets = [net for net in Coverage.get_failing_nets() if net.has_sink() == True]
+    # an output-side net reads at least one signal that is not an input
+    targets = [net for net in nets if any([sink not in ports for sink in net.get_sink_list()]) == True]
+    # only search over the ports that hold a single value
+    ports = [port for port in ports if isinstance(port, Signal) == True]
+    if len(ports) == 0 or len(targets) == 0:
+        return
+    target = max(targets, key=lambda n: n._get_deficit())
+    found = config.get_session()._found.setdefault(target, [])
+
+    state = _snapshot(model)
+
+    def score(values):
+        _restore(model, state)
+        for (port, value) in zip(ports, values):
+            port._value = value
+        model.evaluate()
+        # rank by the target first, then by the other nets that would progress
+        others = sum([1 for net in nets if net is not target and net.would_progress(net.get_sink()) == True])
+        return (target.would_progress(target.get_sink()), others)
+    
+    current = [port._value for port in ports]
+    current_score = score(current)
+    best = current
+    best_score = current_score
+    for j in range(1, candidates):
+        if best_score[0] == True:
+            break
+        # restart from the inputs that made the net progress before
+        if len(found) > 0 and j % _SEARCH_RESTART == 0:
+            values = list(config.get_rng().choice(found))
+        else:
+            values = _neighbor(current, ports)
+        values_score = score(values)
+        # accept sideways moves so the climb can cross plateaus
+        if values_score >= current_score:
+            current = values
+            current_score = values_score
+        if values_score > best_score:
+            best = values
+            best_score = values_score
+        pass
+    if best_score[0] == True and tuple(best) not in found and len(found) < _SEARCH_CACHE:
+        found += [tuple(best)]
+    # leave the model in its starting state with the best inputs applied
+    _restore(model, state)
+    for (port, value) in zip(ports, best):
+        port._value = value
+    pass
+
+
+def randomize(model, strategy: str='none', candidates: int=8):
     '''
     Generates random input values for each attribute for the BFM. This is
     a convenience function for individually setting each signal randomly.
 
     This function mutates the object `model` and returns a reference to the same object.
 
-    A strategy can be provided to provide coverage-driven input test vectors.
+    A strategy can be provided to provide coverage-driven input test vectors:
+    - 'none': draw each input from its distribution
+    - 'linear': advance the first failing net that has a source
+    - 'greedy': advance every failing net whose sources do not overlap, furthest from its goal first
+    - 'lookahead': evaluate the model on a number of `candidates` input vectors and keep the one 
+    that would make progress on the most failing nets. The model must define `evaluate()`.
+    - 'search': hill-climb through up to `candidates` evaluations of the model until the failing 
+    output-side net furthest from its goal would progress. The model must define `evaluate()`.
     '''
     from .coverage import CoverageNet, Coverage
 
@@ -395,7 +1364,7 @@ def randomize(model, strategy: str='none'):
 
     strat: Strategy = Strategy.from_str(strategy)
 
-    ports = [p[1] for p in get_ports(model, mode=Mode.IN)]
+    ports = get_port_plan(model, mode=Mode.IN)
 
     # always randomize all inputs no matter the strategy (default strategy)
     for port in ports:
@@ -420,6 +1389,9 @@ def randomize(model, strategy: str='none'):
                         break
                 else:
                     values = net.advance(rand=True)
+                    # the net may not know how to reach its unmet bins yet
+                    if values == None:
+                        continue
                     # force into an iterable type
                     if type(values) == int:
                         values = [values]
@@ -429,10 +1401,36 @@ def randomize(model, strategy: str='none'):
                 break
             pass
         pass
+    # advance every failing net that writes to ports not already claimed by another net
+    elif strat == Strategy.GREEDY:
+        _advance_greedy(ports)
+    # evaluate several candidates and keep the one that makes the most progress
+    elif strat == Strategy.LOOKAHEAD:
+        _advance_lookahead(model, ports, candidates)
+    # search the input space for values that progress an output-side net
+    elif strat == Strategy.SEARCH:
+        _advance_search(model, ports, candidates)
 
     return model
 
 
+def randomize_batch(model, n: int):
+    '''
+    Generates `n` random input values for each SignalVector port of the BFM, so the 
+    model can evaluate `n` transactions in one call. Input ports declared as a `Signal`
+    are randomized once and hold their value for the entire batch.
+
+    This function mutates the object `model` and returns a reference to the same object.
+    '''
+    for port in get_port_plan(model, mode=Mode.IN):
+        if isinstance(port, SignalVector) == True:
+            port.randomize(n)
+        else:
+            port.randomize()
+        pass
+    return model
+
+
 # Unit Tests
 
 import unittest as _ut
@@ -463,6 +1461,37 @@ class __Test(_ut.TestCase):
         # self.assertEqual(1, 0)
         pass
 
+    def test_alias_dist(self):
+        dist = Distribution([0, 1, 2, 3], weights=[0.1, 0.2, 0.3, 0.4], partition=False)
+        freqs = [0] * 4
+        for sample in dist.samples(k=20_000):
+            freqs[sample] += 1
+        for i, w in enumerate([0.1, 0.2, 0.3, 0.4]):
+            self.assertAlmostEqual(w, freqs[i] / 20_000, delta=0.02)
+
+        dist = Distribution([0, pow2m1(4), range(1, pow2m1(4)-1)], weights=[0.1, 0.1, 0.8], partition=False)
+        samples = dist.samples(k=100)
+        self.assertEqual(100, len(samples))
+        for sample in samples:
+            self.assertEqual(True, sample >= 0 and sample <= pow2m1(4))
+        pass
+
+    def test_range_dist(self):
+        dist = Distribution(range(0, 2**64), weights=[0.5, 0.25, 0.25])
+        self.assertEqual(3, len(dist._partitioned_space))
+        self.assertEqual(0, dist._partitioned_space[0].start)
+        self.assertEqual(2**64, dist._partitioned_space[-1].stop)
+        for sample in dist.samples(k=100) + [dist.sample()]:
+            self.assertEqual(True, sample >= 0 and sample < 2**64)
+
+        s = Signal(width=64, dist=[0.1] * 10)
+        for _ in range(10):
+            s.randomize()
+        # uneven partitions keep every element of the range
+        dist = Distribution(range(0, 10), weights=[1, 1, 1, 1])
+        self.assertEqual([range(0, 3), range(3, 6), range(6, 9), range(9, 10)], dist._partitioned_space)
+        pass
+
     def test_uniform_dist(self):
         dist = Distribution([*range(2**4)], weights=[1/16] * 16)
 
@@ -586,6 +1615,249 @@ class __Test(_ut.TestCase):
         self.assertEqual('1', s.get_bit(4))
         pass
 
+    def test_port_plan(self):
+        config.Config().read_design_if('{"ports": [{"name": "b", "mode": "in"}, {"name": "a", "mode": "in"}, {"name": "y", "mode": "out"}]}')
+        class Model:
+            def __init__(self):
+                self.a = Signal()
+                self.b = Signal()
+                self.y = Signal()
+                self.z = Signal()
+                self.c = None
+                self.n = 0
+                pass
+            pass
+        model = Model()
+        self.assertEqual((model.b, model.a), get_port_plan(model, Mode.IN))
+        self.assertEqual([('y', model.y)], get_ports(model, Mode.OUT))
+        # the plan is reused until the model's signals change
+        self.assertIs(get_port_plan(model, Mode.IN), get_port_plan(model, Mode.IN))
+        model.a = Signal(width=2)
+        self.assertEqual((model.b, model.a), get_port_plan(model, Mode.IN))
+        # an attribute reassigned to a signal becomes a port
+        config.Config().read_design_if('{"ports": [{"name": "b", "mode": "in"}, {"name": "a", "mode": "in"}, {"name": "c", "mode": "in"}]}')
+        get_port_plan(model, Mode.IN)
+        model.c = Signal()
+        self.assertEqual((model.b, model.a, model.c), get_port_plan(model, Mode.IN))
+        # attributes that are neither signals nor named after a port are not checked
+        plan = get_port_plan(model, Mode.IN)
+        model.n = 1
+        self.assertIs(plan, get_port_plan(model, Mode.IN))
+        # the plan is recompiled when the interface changes
+        config.Config().read_design_if('{"ports": [{"name": "a", "mode": "in"}, {"name": "z", "mode": "out"}]}')
+        self.assertEqual((model.a,), get_port_plan(model, Mode.IN))
+        self.assertEqual((model.z,), get_port_plan(model, Mode.OUT))
+        config.Config().read_design_if('{"ports": []}')
+        pass
+
+    def test_slice_view(self):
+        s = Signal(width=8, value=0b1011_0110)
+        self.assertEqual(0b1011, s[7:4].to_int())
+        self.assertEqual(0b0110, s.slice(3, 0).to_int())
+        self.assertEqual('1011', str(s[7:4]))
+        self.assertEqual(-5, s[7:4].to_int(signed=True))
+        s[7:4] = 0b0001
+        self.assertEqual(0b0001_0110, s.to_int())
+        s.slice(3, 0).set('1111')
+        self.assertEqual(0b0001_1111, s.to_int())
+        view = s[5:2]
+        view[0] = '0'
+        self.assertEqual(0b0001_1011, s.to_int())
+        self.assertEqual('1', s[-8 + 4])
+        self.assertRaises(IndexError, lambda: s[8])
+        self.assertRaises(IndexError, lambda: s[8:0])
+        self.assertRaises(IndexError, lambda: s[:4])
+        self.assertRaises(IndexError, lambda: s[7:])
+        self.assertRaises(IndexError, lambda: s[7:0:2])
+        self.assertRaises(IndexError, lambda: s.__setitem__(slice(None, 4), 0))
+
+        s = Signal(width=4, value="0001", endianness='little')
+        self.assertEqual(2, s[3:2].to_int())
+        self.assertEqual('01', str(s[3:2]))
+        pass
+
+    def test_signal_bank(self):
+        config.Config().read_design_if('{"ports": [{"name": "r1", "mode": "in"}, {"name": "r0", "mode": "in"}, {"name": "q", "mode": "out"}]}')
+        class Model:
+            def __init__(self):
+                self.regs = SignalBank(['r0', 'r1'], width=4)
+                self.q = Signal(width=4)
+                pass
+            pass
+        model = Model()
+        self.assertEqual((model.regs['r1'], model.regs['r0']), get_port_plan(model, Mode.IN))
+        model.regs['r0'].set(3)
+        model.regs[1][3] = '1'
+        self.assertEqual([3, 8], model.regs.to_ints())
+        self.assertEqual('0011,1000,', model.regs.to_logic())
+        self.assertEqual(['r0', 'r1'], model.regs.get_names())
+        model.regs.randomize()
+        for sig in model.regs:
+            self.assertEqual(True, sig.to_int() <= sig.max())
+        self.assertRaises(AttributeError, lambda: setattr(model.q, 'extra', 0))
+        config.Config().read_design_if('{"ports": []}')
+        pass
+
+    def test_signal_vector(self):
+        config.Config().read_design_if('{"ports": [{"name": "a", "mode": "in"}, {"name": "b", "mode": "in"}, {"name": "y", "mode": "out"}]}')
+        class Model:
+            def __init__(self):
+                self.a = SignalVector(width=4)
+                self.b = SignalVector(width=4, endianness='little')
+                self.y = SignalVector(width=5)
+                pass
+
+            def evaluate(self):
+                self.y.set([a + b for (a, b) in zip(self.a, self.b)])
+                return self
+            pass
+        model = Model()
+        randomize_batch(model, 100).evaluate()
+        self.assertEqual((model.a, model.b), get_port_plan(model, Mode.IN))
+        self.assertEqual(100, len(model.y))
+        self.assertEqual(model.a[7] + model.b[7], model.y[7])
+        model.b.set([1, 2])
+        self.assertEqual(['1000', '0100'], model.b.to_logic())
+        self.assertEqual('0100', str(model.b.row(1)))
+        self.assertRaises(Exception, lambda: model.b.set([16]))
+        config.Config().read_design_if('{"ports": []}')
+        pass
+
+    def test_greedy_strategy(self):
+        from .coverage import CoverRange, Coverage
+        with config.Session(seed=0):
+            config.Config().read_design_if('{"ports": [{"name": "a", "mode": "in"}, {"name": "b", "mode": "in"}]}')
+            class Model:
+                def __init__(self):
+                    self.a = Signal(width=8)
+                    self.b = Signal(width=8)
+                    pass
+                pass
+            model = Model()
+            CoverRange('a', span=model.a.get_range(), max_steps=16, target=model.a)
+            CoverRange('b', span=model.b.get_range(), max_steps=8, target=model.b)
+            while Coverage.all_passed() == False:
+                randomize(model, strategy='greedy')
+                for net in Coverage.get_nets():
+                    net.cover(net.get_sink())
+            # both nets advance on every transaction
+            self.assertEqual(16, Coverage.count())
+        pass
+
+    def test_snapshot_restore(self):
+        class Pipe:
+            def __init__(self):
+                self.stage = Signal(width=4)
+                self.history = [1, 2]
+                pass
+            pass
+        class Model:
+            def __init__(self):
+                self.a = Signal(width=4, value=3)
+                self.pipe = Pipe()
+                self.regs = {'x': 0}
+                pass
+            pass
+        model = Model()
+        pipe = model.pipe
+        stage = model.pipe.stage
+        history = model.pipe.history
+        state = _snapshot(model)
+        model.a.set(9)
+        stage.set(5)
+        history += [3]
+        model.regs['x'] = 1
+        model.pipe = None
+        model.extra = True
+        _restore(model, state)
+        # the same objects are restored in place
+        self.assertIs(pipe, model.pipe)
+        self.assertIs(stage, model.pipe.stage)
+        self.assertIs(history, model.pipe.history)
+        self.assertEqual(3, model.a.to_int())
+        self.assertEqual(0, stage.to_int())
+        self.assertEqual([1, 2], history)
+        self.assertEqual({'x': 0}, model.regs)
+        self.assertEqual(False, hasattr(model, 'extra'))
+        pass
+
+    def test_lookahead_strategy(self):
+        from .coverage import CoverPoint, Coverage
+        with config.Session(seed=0):
+            config.Config().read_design_if('{"ports": [{"name": "a", "mode": "in"}, {"name": "y", "mode": "out"}]}')
+            class Model:
+                def __init__(self):
+                    self.a = Signal(width=8)
+                    self.y = Signal()
+                    self.evaluations = 0
+                    pass
+
+                def evaluate(self):
+                    self.y.set(int(self.a.to_int() >= 224))
+                    self.evaluations += 1
+                    return self
+                pass
+            model = Model()
+            # an output-side net that cannot be advanced by writing to a source
+            cp = CoverPoint('y high', goal=5, sink=model.y, cover=lambda x: int(x) == 1)
+            while Coverage.all_passed() == False:
+                randomize(model, strategy='lookahead', candidates=8)
+                # the candidates are evaluated from a snapshot of the model
+                self.assertEqual(Coverage.count() - 1, model.evaluations)
+                cp.cover(model.evaluate().y)
+            self.assertLess(Coverage.count(), 10)
+        pass
+
+    def test_lookahead_vector(self):
+        from .coverage import CoverPoint
+        with config.Session(seed=0):
+            config.Config().read_design_if('{"ports": [{"name": "a", "mode": "in"}, {"name": "b", "mode": "in"}, {"name": "y", "mode": "out"}]}')
+            class Model:
+                def __init__(self):
+                    self.a = Signal(width=8)
+                    self.b = SignalVector(width=4, size=3)
+                    self.y = Signal()
+                    pass
+
+                def evaluate(self):
+                    self.y.set(int(self.a.to_int() + sum(self.b.to_ints()) >= 200))
+                    return self
+                pass
+            model = Model()
+            CoverPoint('y high', goal=1, sink=model.y, cover=lambda x: int(x) == 1)
+            before = list(model.b.to_ints())
+            randomize(model, strategy='lookahead', candidates=4)
+            # the vector port keeps its number of transactions and holds the chosen candidate
+            self.assertEqual(3, len(model.b))
+            self.assertIsNot(before, model.b._values)
+        pass
+
+    def test_search_strategy(self):
+        from .coverage import CoverPoint, Coverage
+        with config.Session(seed=0) as session:
+            config.Config().read_design_if('{"ports": [{"name": "a", "mode": "in"}, {"name": "b", "mode": "in"}, {"name": "eq", "mode": "out"}]}')
+            class Model:
+                def __init__(self):
+                    self.a = Signal(width=8)
+                    self.b = Signal(width=8)
+                    self.eq = Signal()
+                    pass
+
+                def evaluate(self):
+                    self.eq.set(int(self.a.to_int() == self.b.to_int()))
+                    return self
+                pass
+            model = Model()
+            # the inputs are equal for 1 in 256 random draws
+            cp = CoverPoint('a equals b', goal=5, sink=model.eq, cover=lambda x: int(x) == 1)
+            while Coverage.all_passed() == False:
+                randomize(model, strategy='search', candidates=64)
+                cp.cover(model.evaluate().eq)
+            self.assertLess(Coverage.count(), 20)
+            # the inputs that made progress are cached for the net
+            self.assertEqual(True, len(session._found[cp]) > 0)
+        pass
+
     def test_to_int_signed(self):
         s = Signal(width=3, value=7)
         self.assertEqual(s.to_int(signed=True), -1)
@@ -7,5 +7,5 @@ from .trace import *
 from .model import *
 from .coverage import *
 from .lib import *
-from .config import rng_seed, get_generic
+from .config import rng_seed, get_generic, Session, get_session
 from .log import set_log_name
\ No newline at end of file
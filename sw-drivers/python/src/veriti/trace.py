@@ -1,10 +1,116 @@
 from . import config
+from enum import Enum as _Enum
+import weakref as _weakref
+import atexit as _atexit
+
+# trace files holding rows in memory that must be written before the interpreter exits
+_buffered_traces = _weakref.WeakSet()
+
+
+@_atexit.register
+def _flush_all():
+    '''
+    Writes any remaining buffered rows for every trace file still alive.
+    '''
+    for trace in list(_buffered_traces):
+        trace.flush()
+    pass
+
+
+class Format(_Enum):
+    BIN = 0
+    HEX = 1
+
+    @staticmethod
+    def from_str(s: str):
+        s = s.lower()
+        if s == 'bin':
+            return Format.BIN
+        elif s == 'hex':
+            return Format.HEX
+        else:
+            raise Exception('Failed to convert str '+s+' to type Format')
+    pass
+
+
+def _to_hex(sig) -> str:
+    '''
+    Casts the signal's logic values into a string of hexadecimal characters. 
+    
+    The bits are grouped in the same order as they are written in the binary
+    format, with the upper-most nibble padded with 0's.
+    '''
+    digits = (sig.get_width() + 3) // 4
+    value = sig.to_int() if sig._big_endian == True else int(sig.to_logic(), 2)
+    return format(value, '0' + str(digits) + 'x')
+
+
+def _to_column(port, rows: int, fmt: Format):
+    '''
+    Serializes the value of a port for each of the `rows` transactions in a batch.
+
+    A `Signal` repeats its single value for every row.
+    '''
+    from .model import SignalVector
+
+    if isinstance(port, SignalVector) == False:
+        return [_to_hex(port) if fmt == Format.HEX else port.to_logic()] * rows
+    if fmt == Format.HEX:
+        spec = '0' + str((port.get_width() + 3) // 4) + 'x'
+        if port._big_endian == True:
+            return [format(v, spec) for v in port]
+        return [format(int(bits, 2), spec) for bits in port.to_logic()]
+    return port.to_logic()
+
+
+class _NetIndex:
+    '''
+    Maps a set of ports to the coverage nets that can be sampled from them. 
+    
+    A net can be sampled when every signal it reads from is one of the ports.
+    The index is maintained incrementally as new coverage nets are created.
+    '''
+
+    def __init__(self, ports):
+        # keep references so the signals remain the keys of this index
+        self._ports = set(ports)
+        self._nets = []
+        # the session's list of coverage nets that was inspected
+        self._group = None
+        # number of coverage nets already inspected
+        self._scanned = 0
+        pass
+
+
+    def get_nets(self):
+        '''
+        Returns the list of coverage nets whose sinks are all within the ports.
+        '''
+        from .coverage import Coverage
+
+        group = Coverage.get_nets()
+        # start over when the session was reset or another session is active
+        if group is not self._group:
+            self._group = group
+            self._nets = []
+            self._scanned = 0
+        # only inspect the nets created since the last lookup
+        if self._scanned < len(group):
+            for net in group[self._scanned:]:
+                if net.has_sink() == True and self._ports.issuperset(net.get_sink_list()) == True:
+                    self._nets += [net]
+                pass
+            self._scanned = len(group)
+        return self._nets
+
+    pass
+
 
 class TraceFile:
     from .model import Mode
     from typing import List as _List
 
-    def __init__(self, name: str, mode: Mode, dir: str=None, order: _List[str]=None):
+    def __init__(self, name: str, mode: Mode, dir: str=None, order: _List[str]=None, buffer_size: int=0, format: Format=Format.BIN):
         '''
         Creates a trace file to write stimuli/results for a potential hardware simulation.
         
@@ -16,6 +122,12 @@ class TraceFile:
         - The `order` argument is the list of port names to write. It must include all ports that match the direction
         set by `mode`. This list determines the order in which to serialize the data when writing traces. If omitted,
         the port order is determined by the order found in the HDL top-level port interface.
+        - The `buffer_size` argument is the number of characters to hold in memory before writing them to the
+        file in one chunk. If set to 0, each row is written as soon as it is appended. Buffered rows are written
+        on `flush()`, `close()`, and when the interpreter exits.
+        - The `format` argument determines how each value is encoded: 'bin' writes each bit as a character, and 'hex' 
+        writes each group of 4 bits as a hexadecimal character. The HDL testbench must read a 'hex' file with the 
+        `HEX` variants of `drive` and `load`.
         '''
         import os
         from .model import Mode
@@ -23,6 +135,7 @@ class TraceFile:
         self._name = name
         # try to decode str if provided as a string
         self._mode = mode if isinstance(mode, str) == False else Mode.from_str(mode)
+        self._format = format if isinstance(format, str) == False else Format.from_str(format)
 
         self._dir = dir if dir != None else config.Config()._working_dir
 
@@ -39,15 +152,47 @@ class TraceFile:
             self._exists = True
 
         self._file = None
+        # map each set of ports written to the coverage nets sampled by them
+        self._net_indices = dict()
+
+        # store rows in memory until enough characters are collected
+        self._buffer_size = buffer_size
+        self._buffer = []
+        self._buffered = 0
+        if self._buffer_size > 0:
+            _buffered_traces.add(self)
         pass
 
 
     def __del__(self):
+        self.close()
+        pass
+
+
+    def _write(self, data: str):
+        '''
+        Writes the `data` to the file, opening it in this scope if it is not
+        already open.
+        '''
         if self._file != None:
-            self._file.close()
+            self._file.write(data)
+        else:
+            with open(self._path, 'a') as fd:
+                fd.write(data)
         pass
 
 
+    def flush(self):
+        '''
+        Writes all rows held in memory to the file.
+        '''
+        if len(self._buffer) > 0:
+            self._write(''.join(self._buffer))
+            self._buffer = []
+            self._buffered = 0
+        return self
+
+
     def open(self):
         '''
         Explicit call to obtain ownership of the file. It is the programmer's
@@ -67,7 +212,10 @@ class TraceFile:
         '''
         Explicit call to release ownership of the file. This operation is
         idempotent.
+
+        Any rows held in memory are written before the file is closed.
         '''
+        self.flush()
         if self._file != None:
             self._file.close()
             self._file = None
@@ -87,41 +235,154 @@ class TraceFile:
         Each value is written with a ',' after the preceeding value in the 
         argument list. A newline is formed after all arguments
         '''
-        from .model import Signal, get_ports
+        from .model import Signal, get_port_plan
         from .coverage import CoverageNet, Coverage
 
         port: Signal
         net: CoverageNet
 
         # ignore the name when collecting the ports for the given mode
-        ports = [p[1] for p in get_ports(model, mode=self._mode)]
-        # check if there are coverages to automatically update
-        for net in Coverage.get_nets():
-            if net.has_sink() == True:
-                # verify the observation involves only signals being written for this transaction
-                sinks = net.get_sink_list()
-                for sink in sinks:
-                    # exit early if a signal being observed is not this transaction
-                    if sink not in ports:
-                        break
-                    pass
-                # perform an observation if the signals are in this transaction
-                else:
-                    net.cover(net.get_sink())
-            pass
+        ports = get_port_plan(model, mode=self._mode)
+        # perform an observation for each coverage to automatically update
+        for net in self._get_net_index(ports).get_nets():
+            net.cover(net.get_sink())
 
         DELIM = ','
         NEWLINE = '\n'
 
-        open_in_scope: bool = self._file == None
-        fd = self._file if open_in_scope == False else open(self._path, 'a')
-        
-        for port in ports:
-            fd.write(str(port.to_logic()) + DELIM)
-        fd.write(NEWLINE)
-        # close the file if it was opened in this current scope
-        if open_in_scope == True:
-            fd.close()
+        # serialize the entire row before writing
+        if self._format == Format.HEX:
+            row = ''.join([_to_hex(port) + DELIM for port in ports]) + NEWLINE
+        else:
+            row = ''.join([str(port.to_logic()) + DELIM for port in ports]) + NEWLINE
+
+        self._emit(row)
+        pass
+
+
+    def append_batch(self, model):
+        '''
+        Writes every transaction held by the directional SignalVector ports of the bus 
+        functional model to the test vector file, one row per transaction.
+
+        Ports declared as a `Signal` write the same value on every row. Each row uses 
+        the same format as `append(...)`, and all rows are written in one go.
+        '''
+        from .model import SignalVector, get_port_plan
+        from .coverage import CoverageNet
+
+        net: CoverageNet
+
+        ports = get_port_plan(model, mode=self._mode)
+        sizes = set([len(port) for port in ports if isinstance(port, SignalVector) == True])
+        if len(sizes) > 1:
+            raise Exception('Cannot write SignalVectors with different numbers of transactions')
+        rows = sizes.pop() if len(sizes) > 0 else 1
+        # perform an observation of every transaction for each coverage to automatically update
+        for net in self._get_net_index(ports).get_nets():
+            net.cover_batch(net.get_sink())
+
+        DELIM = ','
+        NEWLINE = '\n'
+
+        # serialize each port as a column before joining them into rows
+        columns = [_to_column(port, rows, self._format) for port in ports]
+        self._emit(''.join([DELIM.join(row) + DELIM + NEWLINE for row in zip(*columns)]))
+        pass
+
+
+    def _get_net_index(self, ports) -> _NetIndex:
+        '''
+        Looks up the coverage nets that observe only signals in the set of `ports`.
+        '''
+        index = self._net_indices.get(ports)
+        if index == None:
+            index = _NetIndex(ports)
+            self._net_indices[ports] = index
+        return index
+
+
+    def _emit(self, data: str):
+        '''
+        Writes the serialized rows in `data`, holding them in memory when buffering
+        is enabled.
+        '''
+        if self._buffer_size > 0:
+            self._buffer += [data]
+            self._buffered += len(data)
+            # write the rows in one large chunk once the buffer is full
+            if self._buffered >= self._buffer_size:
+                self.flush()
+        else:
+            self._write(data)
+        pass
+
+    pass
+
+import unittest as _ut
+
+class __Test(_ut.TestCase):
+
+    def test_net_index_rescan(self):
+        from .model import Signal
+        from .coverage import CoverPoint
+
+        with config.Session(seed=0) as session:
+            a = Signal()
+            index = _NetIndex((a,))
+            cp = CoverPoint('a high', target=a)
+            self.assertEqual([cp], index.get_nets())
+            # the nets created after the last lookup are picked up
+            cp2 = CoverPoint('a also high', target=a)
+            self.assertEqual([cp, cp2], index.get_nets())
+            # a reset replaces the session's nets
+            session.reset()
+            self.assertEqual([], index.get_nets())
+            cp3 = CoverPoint('a high again', target=a)
+            self.assertEqual([cp3], index.get_nets())
+        pass
+
+
+
+    def test_buffered_close(self):
+        import os, tempfile
+        from .model import Signal
+
+        with config.Session(seed=0), tempfile.TemporaryDirectory() as dir:
+            config.Config().read_design_if('{"ports": [{"name": "a", "mode": "in"}]}')
+            class Model:
+                def __init__(self):
+                    self.a = Signal(width=4, value=5)
+                    pass
+                pass
+            model = Model()
+            trace = TraceFile('inputs.trace', mode='in', dir=dir, buffer_size=1024)
+            trace.append(model)
+            trace.append(model)
+            # the rows stay in memory until the buffer is full
+            self.assertEqual(0, os.path.getsize(trace._path))
+            trace.close()
+            with open(trace._path, 'r') as f:
+                self.assertEqual('0101,\n0101,\n', f.read())
+        pass
+
+
+    def test_to_hex(self):
+        from .model import Signal, SignalVector
+
+        for width in [1, 4, 5, 7, 9]:
+            for endianness in ['big', 'little']:
+                sig = Signal(width=width, value=(0b1011001 % (2**width)), endianness=endianness)
+                digits = _to_hex(sig)
+                self.assertEqual((width + 3) // 4, len(digits))
+                # the hex digits decode back to the bits written in the binary format
+                self.assertEqual(sig.to_logic(), format(int(digits, 16), '0' + str(width) + 'b'))
+                vec = SignalVector(width=width, size=2, endianness=endianness)
+                vec.set([1, 2**width - 1])
+                self.assertEqual(vec.to_logic(), [format(int(h, 16), '0' + str(width) + 'b') for h in _to_column(vec, 2, Format.HEX)])
+                pass
+        self.assertEqual('16', _to_hex(Signal(width=5, value=0b10110, endianness='big')))
+        self.assertEqual('0d', _to_hex(Signal(width=5, value=0b10110, endianness='little')))
         pass
 
-    pass
\ No newline at end of file
+    pass
@@ -31,10 +31,10 @@ class Adder:
 
     def evaluate(self):
         result = self.in0.to_int() + self.in1.to_int() + self.cin.to_int()
-        temp = Signal(width=self.in0.get_width()+1, value=result, endianness='big').to_logic()
+        temp = Signal(width=self.in0.get_width()+1, value=result, endianness='big')
         # slice and dice
-        self.sum.set(temp[1:])
-        self.cout.set(temp[0])
+        self.sum.set(temp[self.in0.get_width()-1:0].to_int())
+        self.cout.set(int(temp[self.in0.get_width()]))
         return self
     pass
 
@@ -141,9 +141,9 @@ while Coverage.all_passed(MAX_SIMS) == False:
     # Create a new input to enter through the algorithm and
     # use coverage-driven test generation (CDTG) using linear priorities.
     
-    # When specifying CDTG ('linear'), it provides a 7x reduction in tests 
+    # When specifying CDTG ('linear'), it provides a 5-8x reduction in tests 
     # required to meet coverage as compared to truly random ('none').
-    # It reduces 2010 tests to 288 to achieve the same coverage.
+    # It needs fewer than 300 tests to achieve the same coverage.
     txn = randomize(model, strategy='linear')
 
     # write each incoming transaction to the DUT